@@ -25,6 +25,7 @@ setup(
     python_requires='>=3.7',
     install_requires=[
         'numpy',
+        'scipy',
         'pandas',
         'pyqtgraph',
         'PyQt5',
@@ -7,6 +7,9 @@ from simworld.utils.vector import Vector
 class BaseAgent:
     """Base class for all agents in the simulation."""
 
+    # Agents are created per pedestrian and vehicle, so subclasses declare slots too and skip the instance dict
+    __slots__ = ('_position', '_direction', '_yaw')
+
     def __init__(self, position: Vector, direction: Vector):
         """Initialize the base agent.
 
@@ -62,4 +65,6 @@ class BaseAgent:
             yaw: The new yaw of the agent.
         """
         self._yaw = yaw
-        self._direction = Vector(math.cos(math.radians(yaw)), math.sin(math.radians(yaw))).normalize()
+        # cos and sin already give a unit vector, so no normalize() is needed
+        radians = math.radians(yaw)
+        self._direction = Vector(math.cos(radians), math.sin(radians))
@@ -10,6 +10,8 @@ from simworld.utils.vector import Vector
 class Humanoid(BaseAgent):
     """Humanoid agent class."""
 
+    __slots__ = ('id', 'camera_id', 'map', 'communicator', 'config', 'scooter_id')
+
     _id_counter = 0
     _camera_id_counter = 1
 
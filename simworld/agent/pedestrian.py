@@ -1,9 +1,8 @@
 """Pedestrian agent module for simulating pedestrians in traffic."""
 import math
+from collections import deque
 from enum import Enum, auto
 
-import numpy as np
-
 from simworld.agent.base_agent import BaseAgent
 from simworld.utils.vector import Vector
 
@@ -18,6 +17,8 @@ class PedestrianState(Enum):
 class Pedestrian(BaseAgent):
     """Pedestrian agent for traffic simulation."""
 
+    __slots__ = ('id', 'current_sidewalk', 'waypoints', 'state', 'speed')
+
     _id_counter = 0
 
     def __init__(self, position: Vector, direction: Vector, current_sidewalk, speed: float = 100):
@@ -34,7 +35,7 @@ class Pedestrian(BaseAgent):
         Pedestrian._id_counter += 1
 
         self.current_sidewalk = current_sidewalk
-        self.waypoints = []
+        self.waypoints = deque()
         self.state = PedestrianState.STOP
 
         self.speed = speed
@@ -50,7 +51,7 @@ class Pedestrian(BaseAgent):
 
     def __repr__(self):
         """Return a detailed string representation of the pedestrian."""
-        return f'Pedestrian(id={self.id}, current_sidewalk={self.current_sidewalk.id}, position={self.position}, direction={self.direction}, waypoints={self.waypoints})'
+        return f'Pedestrian(id={self.id}, current_sidewalk={self.current_sidewalk.id}, position={self.position}, direction={self.direction}, waypoints={list(self.waypoints)})'
 
     def change_to_next_sidewalk(self, next_sidewalk):
         """Change the pedestrian's current sidewalk to the next sidewalk.
@@ -76,7 +77,7 @@ class Pedestrian(BaseAgent):
         Returns:
             Vector: The first waypoint.
         """
-        return self.waypoints.pop(0)
+        return self.waypoints.popleft()
 
     def is_close_to_end(self, waypoint_distance_threshold: float):
         """Check if the pedestrian is close to the end of the sidewalk.
@@ -89,7 +90,7 @@ class Pedestrian(BaseAgent):
         """
         if len(self.waypoints) == 0:
             return False
-        return self.position.distance(self.waypoints[-1]) < waypoint_distance_threshold
+        return self.position.distance_sq(self.waypoints[-1]) < waypoint_distance_threshold * waypoint_distance_threshold
 
     def complete_turn(self):
         """Check if the pedestrian has completed turning around.
@@ -99,7 +100,7 @@ class Pedestrian(BaseAgent):
         """
         if self.state == PedestrianState.TURN_AROUND and len(self.waypoints) > 0:
             to_waypoint = self.waypoints[0] - self.position
-            angle = math.degrees(math.acos(np.clip(self.direction.dot(to_waypoint.normalize()), -1, 1)))
+            angle = math.degrees(math.atan2(abs(self.direction.cross(to_waypoint)), self.direction.dot(to_waypoint)))
             # complete turn if agent is facing the waypoint or the angle has passed the point
             return angle < 2 or angle >= 90
         return False
@@ -115,9 +116,10 @@ class Pedestrian(BaseAgent):
         """
         to_waypoint = waypoint - self.position
 
-        angle = math.degrees(math.acos(np.clip(self.direction.dot(to_waypoint.normalize()), -1, 1)))
-
+        # atan2 of the cross and dot products gives the angle without normalizing or clipping
         cross_product = self.direction.cross(to_waypoint)
+        angle = math.degrees(math.atan2(abs(cross_product), self.direction.dot(to_waypoint)))
+
         turn_direction = 'left' if cross_product < 0 else 'right'
 
         if angle < 2:
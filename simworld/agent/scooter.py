@@ -7,6 +7,8 @@ from simworld.utils.vector import Vector
 class Scooter(BaseAgent):
     """Scooter agent for traffic simulation."""
 
+    __slots__ = ('id', 'throttle', 'brake', 'steering')
+
     _id_counter = 0
 
     def __init__(self, position: Vector, direction: Vector):
@@ -1,4 +1,6 @@
 """Vehicle agent module for simulating vehicles in traffic."""
+import math
+from collections import deque
 from enum import Enum, auto
 
 import numpy as np
@@ -17,9 +19,30 @@ class VehicleState(Enum):
     STOPPED = auto()  # stopped for red light or avoiding collision
 
 
+def gather_object_states(vehicles, pedestrians) -> tuple:
+    """Gather the positions, headings and lengths of vehicles and pedestrians into arrays.
+
+    Args:
+        vehicles: List of vehicles.
+        pedestrians: List of pedestrians.
+
+    Returns:
+        tuple: Vehicle ids, vehicle positions, vehicle directions, vehicle lengths and pedestrian positions.
+    """
+    ids = np.fromiter((vehicle.id for vehicle in vehicles), dtype=np.int64, count=len(vehicles))
+    positions = np.array([(vehicle.position.x, vehicle.position.y) for vehicle in vehicles], dtype=np.float64).reshape(-1, 2)
+    directions = np.array([(vehicle.direction.x, vehicle.direction.y) for vehicle in vehicles], dtype=np.float64).reshape(-1, 2)
+    lengths = np.fromiter((vehicle.length for vehicle in vehicles), dtype=np.float64, count=len(vehicles))
+    pedestrian_positions = np.array([(pedestrian.position.x, pedestrian.position.y) for pedestrian in pedestrians], dtype=np.float64).reshape(-1, 2)
+    return ids, positions, directions, lengths, pedestrian_positions
+
+
 class Vehicle(BaseAgent):
     """Vehicle agent for traffic simulation."""
 
+    __slots__ = ('id', 'config', 'current_lane', 'waypoints', 'state', 'steering_pid', 'vehicle_reference',
+                 'length', 'width', 'max_steering', 'throttle', 'brake', 'steering')
+
     _id_counter = 0
 
     def __init__(self, position: Vector, direction: Vector, current_lane, vehicle_reference: str, config, length: float = 500, width: float = 200):
@@ -42,7 +65,7 @@ class Vehicle(BaseAgent):
 
         # movement attributes
         self.current_lane = current_lane
-        self.waypoints = []
+        self.waypoints = deque()
 
         self.state = VehicleState.STOPPED
 
@@ -69,7 +92,7 @@ class Vehicle(BaseAgent):
 
     def __repr__(self):
         """Return a detailed string representation of the vehicle."""
-        return f'Vehicle(id={self.id}, current_lane={self.current_lane.id}, position={self.position}, direction={self.direction}, yaw={self.yaw}, waypoints={self.waypoints})'
+        return f'Vehicle(id={self.id}, current_lane={self.current_lane.id}, position={self.position}, direction={self.direction}, yaw={self.yaw}, waypoints={list(self.waypoints)})'
 
     def compute_control(self, waypoint, dt):
         """Compute throttle, brake, steering.
@@ -136,60 +159,59 @@ class Vehicle(BaseAgent):
         Returns:
             bool: True if vehicle is close to the end of the lane.
         """
-        return self.position.distance(self.current_lane.end) < self.config['traffic.vehicle.distance_to_end'] + self.length / 2
+        return self.position.distance_sq(self.current_lane.end) < (self.config['traffic.vehicle.distance_to_end'] + self.length / 2) ** 2
 
-    def is_close_to_object(self, vehicles, pedestrians):
+    def is_close_to_object(self, vehicles, pedestrians, object_states: tuple = None):
         """Detect objects in the vehicle's path.
 
         Args:
             vehicles: List of vehicles to check for proximity.
             pedestrians: List of pedestrians to check for proximity.
+            object_states: Arrays returned by gather_object_states for the same vehicles and pedestrians,
+                so callers checking every vehicle in a tick only gather them once.
 
         Returns:
             bool: True if the vehicle is close to any object.
         """
-        # Define detection area (cone-shaped area in front of vehicle)
-        DETECTION_ANGLE = self.config['traffic.detection_angle']
-        PEDESTRIAN_DETECTION_DISTANCE = 2 * self.config['traffic.distance_between_objects'] + self.length / 2
-
-        # Check vehicles
-        for vehicle in vehicles:
-            VEHICLE_DETECTION_DISTANCE = 1.5 * self.config['traffic.distance_between_objects'] + self.length / 2 + vehicle.length / 2
-            if vehicle.id == self.id:
-                continue
-
-            # Calculate relative position
-            position_diff = vehicle.position - self.position
-            distance = self.position.distance(vehicle.position)
+        if object_states is None:
+            object_states = gather_object_states(vehicles, pedestrians)
+        ids, positions, directions, lengths, pedestrian_positions = object_states
 
-            # Check if object is in detection cone
-            if distance > VEHICLE_DETECTION_DISTANCE:
-                continue
-
-            # First check if object is in front of the vehicle using dot product
-            if vehicle.direction.dot(self.direction) <= 0:  # object is behind or beside the vehicle
-                continue
-
-            # Calculate angle between vehicle direction and position difference
-            angle = abs(np.degrees(np.arccos(np.clip(position_diff.normalize().dot(self.direction), -1, 1))))
-
-            if angle <= DETECTION_ANGLE:
-                return True
+        # Define detection area (cone-shaped area in front of vehicle)
+        min_cosine = math.cos(math.radians(self.config['traffic.detection_angle']))
+        distance_between_objects = self.config['traffic.distance_between_objects']
+        heading = np.array((self.direction.x, self.direction.y))
+        origin = (self.position.x, self.position.y)
+
+        # Check vehicles that are close and move the same way
+        offsets = positions - origin
+        distances = np.hypot(offsets[:, 0], offsets[:, 1])
+        candidates = (ids != self.id) & (distances <= 1.5 * distance_between_objects + self.length / 2 + lengths / 2) & (directions @ heading > 0)
+        if self._in_detection_cone(offsets[candidates], distances[candidates], heading, min_cosine):
+            return True
 
         # Check pedestrians
-        for pedestrian in pedestrians:
-            position_diff = pedestrian.position - self.position
-            distance = self.position.distance(pedestrian.position)
+        offsets = pedestrian_positions - origin
+        distances = np.hypot(offsets[:, 0], offsets[:, 1])
+        candidates = distances <= 2 * distance_between_objects + self.length / 2
+        return self._in_detection_cone(offsets[candidates], distances[candidates], heading, min_cosine)
 
-            if distance > PEDESTRIAN_DETECTION_DISTANCE:
-                continue
+    @staticmethod
+    def _in_detection_cone(offsets: np.ndarray, distances: np.ndarray, heading: np.ndarray, min_cosine: float) -> bool:
+        """Check whether any relative position lies within the detection cone around a heading.
 
-            angle = abs(np.degrees(np.arccos(np.clip(position_diff.normalize().dot(self.direction), -1, 1))))
-
-            if angle <= DETECTION_ANGLE:
-                return True
+        Args:
+            offsets: Relative positions of the objects.
+            distances: Distances to the objects.
+            heading: Direction of the vehicle.
+            min_cosine: Cosine of the detection angle.
 
-        return False
+        Returns:
+            bool: True if any object is inside the cone.
+        """
+        # An object right on top of the vehicle counts as perpendicular, as the normalized zero vector did
+        cosines = np.divide(offsets @ heading, distances, out=np.zeros_like(distances), where=distances > 0)
+        return bool(np.any(cosines >= min_cosine))
 
     def change_to_next_lane(self, next_lane):
         """Change the vehicle's current lane to the next lane.
@@ -218,7 +240,7 @@ class Vehicle(BaseAgent):
         Returns:
             Vector: The first waypoint.
         """
-        return self.waypoints.pop(0)
+        return self.waypoints.popleft()
 
     def set_attributes(self, throttle: float, brake: float, steering: float):
         """Set the vehicle's control attributes.
@@ -1,18 +1,22 @@
 """This module provides functionality for retrieving and placing assets in the city simulation."""
 import importlib.resources as pkg_resources
 import os
+from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
 from sentence_transformers import SentenceTransformer
 
 from simworld.assets_rp.utils.assets_rp_utils import (
     construct_building_from_candidate, get_coordinates_around_building,
     get_parsed_input, get_surroundings, place_target_asset,
-    retrieve_target_asset, vector_cosine_similarity)
+    retrieve_target_asset)
+from simworld.assets_rp.utils.embedding_cache import EmbeddingCache
 from simworld.assets_rp.utils.reference_assets_retriever import \
     ReferenceAssetsRetriever
 from simworld.citygen.dataclass.dataclass import Point
 from simworld.config import Config
 from simworld.utils.data_importer import DataImporter
+from simworld.utils.load_json import load_json
 from simworld.utils.logger import Logger
 
 
@@ -33,61 +37,178 @@ class AssetsRetrieverPlacer:
         """
         self.config = config
         self.env_description_retrieval_model_name = env_description_retrieval_model_name if env_description_retrieval_model_name else config['assets_rp.env_description_retrieval_model']
-        self.model = SentenceTransformer(self.env_description_retrieval_model_name)
+        self.env_description_retrieval_backend = config['assets_rp.env_description_retrieval_backend']
+        self.env_description_retrieval_model_file = config['assets_rp.env_description_retrieval_model_file']
+        self._model = None
+        self._embedding_cache = None
         self.data_importer = DataImporter(config)
         self.input_dir = input_dir
-        self.city_generator = self.data_importer.import_city_data(input_dir)
+        self._city_generator = None
+        self._world_nodes = None
 
         self.logger = Logger().get_logger('AssetsRP')
 
-    def generate_assets_manually(self, natural_language_input, sample_dataset_dir: str = None, output_dir: str = None,  description_map_path: str = None, assets_retrieval_model: str = None):
-        """This function is used to retrieve and place the assets based on user's prompt.
+        # The city does not change after import, so the retriever and the surroundings of every asset are computed once
+        # per description map, on the first query that needs them, and reused by every later query
+        self._reference_indexes = {}
+
+    @property
+    def model(self) -> SentenceTransformer:
+        """Get the environment description retrieval model, loading it on first use."""
+        if self._model is None:
+            self._model = self._load_model()
+        return self._model
+
+    @property
+    def embedding_cache(self) -> EmbeddingCache:
+        """Get the on-disk embedding cache, opening it on first use."""
+        if self._embedding_cache is None:
+            # Other backends or quantized exports give slightly different vectors, so they must not share cache entries
+            cache_model_name = self.env_description_retrieval_model_name
+            if self.env_description_retrieval_backend != 'torch':
+                cache_model_name = f'{cache_model_name}:{self.env_description_retrieval_backend}:{self.env_description_retrieval_model_file}'
+            self._embedding_cache = EmbeddingCache(self.config['assets_rp.embedding_cache_path'], cache_model_name)
+        return self._embedding_cache
+
+    @property
+    def city_generator(self):
+        """Get the city imported from the input directory, importing it on first use."""
+        if self._city_generator is None:
+            self._city_generator = self.data_importer.import_city_data(self.input_dir)
+        return self._city_generator
+
+    @property
+    def world_nodes(self) -> list:
+        """Get the asset nodes of the world graph, reading progen_world.json on first use."""
+        if self._world_nodes is None:
+            self._world_nodes = load_json(os.path.join(self.input_dir, 'progen_world.json')).get('nodes', [])
+        return self._world_nodes
+
+    def _load_model(self) -> SentenceTransformer:
+        """Load the environment description retrieval model with the configured backend.
+
+        Returns:
+            The SentenceTransformer model.
+
+        Raises:
+            ValueError: If the configured backend is not supported.
+        """
+        backend = self.env_description_retrieval_backend
+        if backend == 'torch':
+            return SentenceTransformer(self.env_description_retrieval_model_name)
+        if backend not in ('onnx', 'openvino'):
+            raise ValueError(f'Unsupported env description retrieval backend: {backend}')
+        # ONNX Runtime and OpenVINO run faster on CPU, and model_file can select a quantized export
+        # such as onnx/model_qint8_avx512_vnni.onnx
+        model_kwargs = {'file_name': self.env_description_retrieval_model_file} if self.env_description_retrieval_model_file else None
+        return SentenceTransformer(self.env_description_retrieval_model_name, backend=backend, model_kwargs=model_kwargs)
+
+    def _get_reference_index(self, description_map_path: str):
+        """Get the reference asset retriever and the surroundings embeddings of its assets.
 
         Args:
-            natural_language_input: the text prompt provided by the users.
-            sample_dataset_dir: the directory to load the images of the assets.
-            output_dir: the directory to save the output.
             description_map_path: the path to the description map file.
-            assets_retrieval_model: the name of the assets retrieval model.
+
+        Returns:
+            A tuple of (retriever, surroundings_matrix, row_by_node_id), where row_by_node_id maps an asset id
+            to its row in surroundings_matrix.
         """
-        # 1. Parse the input
-        parsed_input, asset_to_place, reference_asset_query, relation, surroundings_query = get_parsed_input(natural_language_input)
+        city_version = self.city_generator.version
+        if description_map_path not in self._reference_indexes:
+            retriever = ReferenceAssetsRetriever(os.path.join(self.input_dir, 'progen_world.json'), description_map_path,
+                                                 self.env_description_retrieval_model_name, self.embedding_cache, self.model, self.world_nodes)
+            surroundings_matrix = self._precompute_surroundings_matrix(retriever.nodes, description_map_path)
+            row_by_node_id = {node['id']: row for row, node in enumerate(retriever.nodes)}
+            self._reference_indexes[description_map_path] = (retriever, surroundings_matrix, row_by_node_id, city_version)
+        else:
+            retriever, surroundings_matrix, row_by_node_id, index_version = self._reference_indexes[description_map_path]
+            if index_version != city_version:
+                # Adding or removing a building or element changes the surroundings of its neighbours too. Only the
+                # changed surroundings miss the embedding cache, so this re-encodes just the affected assets.
+                self.logger.info('City changed since the surroundings were embedded, refreshing them')
+                surroundings_matrix = self._precompute_surroundings_matrix(retriever.nodes, description_map_path)
+                self._reference_indexes[description_map_path] = (retriever, surroundings_matrix, row_by_node_id, city_version)
+        return retriever, surroundings_matrix, row_by_node_id
+
+    def _precompute_surroundings_matrix(self, nodes: list, description_map_path: str) -> np.ndarray:
+        """Embed the surroundings of every asset.
 
-        self.logger.info('LLM parse result: %s', parsed_input)
+        Args:
+            nodes: the asset nodes of the world graph.
+            description_map_path: the path to the description map file.
 
-        # 2. Load the file that store all the assets. Find the candidates that match "reference_asset_query"
-        _progen_world_path = os.path.join(self.input_dir, 'progen_world.json')
-        _description_map_path = description_map_path if description_map_path else self.config['assets_rp.input_description_map']
-        referenceAssetRetriever = ReferenceAssetsRetriever(_progen_world_path, _description_map_path, self.env_description_retrieval_model_name)
+        Returns:
+            A 2D float32 NumPy array with one L2-normalized surroundings embedding per node, in the order of nodes.
+        """
+        surroundings_strs = []
+        for node in nodes:
+            x = node['properties']['location']['x'] / 100
+            y = node['properties']['location']['y'] / 100
+            surroundings = self.city_generator.route_generator.get_point_around_label(Point(x, y), self.city_generator.city_quadtrees, 200, 20)
+
+            # Integrate the surrounding information to a string
+            surroundings_strs.append(get_surroundings(surroundings, description_map_path))
+
+        self.logger.info('Embedding the surroundings of %d assets', len(surroundings_strs))
+        # Stored in the embedding cache, so later runs on the same city skip the model
+        surroundings_matrix = self.embedding_cache.get_or_compute_many(
+            surroundings_strs,
+            lambda texts: self.model.encode(texts, batch_size=64, convert_to_numpy=True),
+        )
+        # Normalized once, so a cosine similarity is a plain dot product at query time
+        norms = np.linalg.norm(surroundings_matrix, axis=1, keepdims=True)
+        return surroundings_matrix / np.maximum(norms, np.finfo(np.float32).tiny)
+
+    def _find_reference_asset(self, reference_asset_query: str, surroundings_query: str, description_map_path: str):
+        """Find the asset matching the reference query whose surroundings best match the surroundings query.
+
+        Args:
+            reference_asset_query: the description of the reference asset.
+            surroundings_query: the description of the surroundings of the reference asset.
+            description_map_path: the path to the description map file.
+
+        Returns:
+            The reference asset as a Building, or None if it cannot be constructed.
+        """
+        # Find the candidates in the world graph that match "reference_asset_query"
+        referenceAssetRetriever, surroundings_matrix, row_by_node_id = self._get_reference_index(description_map_path)
         candidate_nodes = referenceAssetRetriever.retrieve_reference_assets(reference_asset_query)
 
-        # 3. For each candidate, use "_get_point_around_label" to obtain its surrounding asset
-        candidate_similarity_scores = []
-        for candidate, base_score in candidate_nodes:
-            x = candidate['properties']['location']['x'] / 100
-            y = candidate['properties']['location']['y'] / 100
-            node_position = Point(x, y)
-            candidate_surroundings = self.city_generator.route_generator.get_point_around_label(node_position, self.city_generator.city_quadtrees, 200, 20)
-
-            # 4. Integrate the surrounding information to a string and do embedding, and calculate the similarity score.
-            candidate_surroundings_str = get_surroundings(candidate_surroundings, _description_map_path)
-            candidate_embedding = self.model.encode(candidate_surroundings_str)
-            query_embedding = self.model.encode(surroundings_query)
-
-            similarity = vector_cosine_similarity(candidate_embedding, query_embedding)
-            candidate_similarity_scores.append((candidate, similarity))
-            # self.logger.info(f"candidate nodes: {candidate['id']} similarity score: {similarity:.4f}")
-
-        # 5. Choose the highest score as final reference asset and construct the instance
-        best_candidate, best_similarity = max(candidate_similarity_scores, key=lambda x: x[1])
+        # Embed the query only, the surroundings of every candidate were embedded at initialization
+        query_embedding = self.model.encode(surroundings_query, convert_to_numpy=True)
+
+        # Calculate the similarity scores between the query and the surroundings of all candidates in one product
+        query_norm = np.linalg.norm(query_embedding)
+        if query_norm > 0:
+            query_embedding = query_embedding / query_norm
+        candidate_rows = [row_by_node_id[candidate['id']] for candidate, _ in candidate_nodes]
+        similarity_scores = surroundings_matrix[candidate_rows] @ query_embedding
+
+        # Choose the highest score as final reference asset and construct the instance
+        best_index = int(similarity_scores.argmax())
+        best_candidate, best_similarity = candidate_nodes[best_index][0], float(similarity_scores[best_index])
         self.logger.info('best candidate: %s similarity score: %s', best_candidate['id'], best_similarity)
 
         reference_asset = construct_building_from_candidate(best_candidate, os.path.join(self.input_dir, 'buildings.json'))
         if reference_asset is None:
             self.logger.error('No reference asset found for %s', best_candidate['id'])
-            return
+        return reference_asset
+
+    def generate_assets_manually(self, natural_language_input, sample_dataset_dir: str = None, output_dir: str = None,  description_map_path: str = None, assets_retrieval_model: str = None):
+        """This function is used to retrieve and place the assets based on user's prompt.
+
+        Args:
+            natural_language_input: the text prompt provided by the users.
+            sample_dataset_dir: the directory to load the images of the assets.
+            output_dir: the directory to save the output.
+            description_map_path: the path to the description map file.
+            assets_retrieval_model: the name of the assets retrieval model.
+        """
+        # 1. Parse the input
+        parsed_input, asset_to_place, reference_asset_query, relation, surroundings_query = get_parsed_input(natural_language_input, self.config['assets_rp.parse_cache_path'])
+
+        self.logger.info('LLM parse result: %s', parsed_input)
 
-        # 6. Use CLIP to obtain the asset and place around the best candidate
         if sample_dataset_dir is None:
             self.logger.info('No sample dataset directory provided, using default')
             _sample_dataset_dir = pkg_resources.files('simworld.data').joinpath(self.config['assets_rp.input_sample_dataset'])
@@ -100,8 +221,19 @@ class AssetsRetrieverPlacer:
         else:
             _assets_retrieval_model = assets_retrieval_model
 
+        _description_map_path = description_map_path if description_map_path else self.config['assets_rp.input_description_map']
+
+        # 2. Use CLIP to obtain the target assets in the background, it only depends on the parsed input
+        # 3. Meanwhile, find the reference asset whose surroundings best match the query
         self.logger.info('Using %s to retrieve target assets', _assets_retrieval_model)
-        target_assets = retrieve_target_asset(asset_to_place, _sample_dataset_dir, _assets_retrieval_model)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            target_assets_future = executor.submit(retrieve_target_asset, asset_to_place, _sample_dataset_dir, _assets_retrieval_model)
+            reference_asset = self._find_reference_asset(reference_asset_query, surroundings_query, _description_map_path)
+            target_assets = target_assets_future.result()
+        if reference_asset is None:
+            return
+
+        # 4. Place the target assets around the reference asset
         self.logger.info('target assets: %s', target_assets)
         target_positions = get_coordinates_around_building(self.city_generator.config, reference_asset, relation, len(target_assets))
         self.logger.info('target positions: %s', target_positions)
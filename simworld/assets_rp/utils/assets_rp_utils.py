@@ -17,11 +17,25 @@ from simworld.citygen.dataclass.dataclass import Bounds, Building, Point
 from simworld.utils.load_json import load_json
 
 
-def get_parsed_input(natural_language_input):
+@lru_cache(maxsize=1)
+def get_input_parser(cache_path: str = None) -> InputParser:
+    """Get the shared input parser, so its API client and connections are reused across prompts.
+
+    Args:
+        cache_path: optional path to the parse result cache.
+
+    Returns:
+        The InputParser instance.
+    """
+    return InputParser(cache_path=cache_path)
+
+
+def get_parsed_input(natural_language_input, cache_path: str = None):
     """Use LLMs to parse the natural language input into 4 parts for post-handling.
 
     Args:
         natural_language_input: the input text prompt.
+        cache_path: optional path to the parse result cache.
 
     Returns:
         asset_to_place: the asset that user wants to place
@@ -29,8 +43,7 @@ def get_parsed_input(natural_language_input):
         relation: which direction/relation should be placed relative to reference_asset
         surrounding_assets: the surrounding assets of the user
     """
-    inputParser = InputParser()
-    parsed_input = inputParser.parse_input(natural_language_input)
+    parsed_input = get_input_parser(cache_path).parse_input(natural_language_input)
     asset_to_place = parsed_input['asset_to_place']
     reference_asset_query = parsed_input['reference_asset']
     relation = parsed_input['relation']
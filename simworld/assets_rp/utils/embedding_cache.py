@@ -0,0 +1,66 @@
+"""This module stores sentence embeddings on disk so that repeated texts skip the model."""
+import hashlib
+import os
+import sqlite3
+from threading import Lock
+
+import numpy as np
+
+# SQLite limits the number of parameters in one statement
+_QUERY_CHUNK_SIZE = 500
+
+
+class EmbeddingCache:
+    """Persistent cache of text embeddings keyed by a hash of the model name and the text."""
+    def __init__(self, path: str, model_name: str):
+        """Open the cache, creating the database file if needed.
+
+        Args:
+            path: the path to the SQLite database file.
+            model_name: the name of the model producing the embeddings, so different models never share entries.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.model_name = model_name
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute('CREATE TABLE IF NOT EXISTS embeddings (key BLOB PRIMARY KEY, vector BLOB NOT NULL)')
+        self.connection.commit()
+        self.lock = Lock()
+
+    def _key(self, text: str) -> bytes:
+        return hashlib.blake2b(f'{self.model_name}\x00{text}'.encode('utf-8'), digest_size=16).digest()
+
+    def get_or_compute_many(self, texts: list, compute) -> np.ndarray:
+        """Get the embeddings of texts, computing and storing only the ones not cached yet.
+
+        Args:
+            texts: a list of strings to embed.
+            compute: a function mapping a list of strings to a 2D array with one embedding per string.
+
+        Returns:
+            A 2D float32 NumPy array with one embedding per text, in the order of texts.
+        """
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+
+        keys = [self._key(text) for text in texts]
+        unique_keys = list(dict.fromkeys(keys))
+        found = {}
+        with self.lock:
+            for start in range(0, len(unique_keys), _QUERY_CHUNK_SIZE):
+                chunk = unique_keys[start:start + _QUERY_CHUNK_SIZE]
+                placeholders = ', '.join('?' * len(chunk))
+                found.update(self.connection.execute(f'SELECT key, vector FROM embeddings WHERE key IN ({placeholders})', chunk))
+
+        missing = [key for key in unique_keys if key not in found]
+        if missing:
+            text_by_key = dict(zip(keys, texts))
+            vectors = np.asarray(compute([text_by_key[key] for key in missing]), dtype=np.float32)
+            computed = {key: vector.tobytes() for key, vector in zip(missing, vectors)}
+            with self.lock:
+                with self.connection:
+                    self.connection.executemany('INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)', computed.items())
+            found.update(computed)
+
+        return np.stack([np.frombuffer(found[key], dtype=np.float32) for key in keys])
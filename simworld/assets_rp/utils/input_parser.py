@@ -1,23 +1,27 @@
 """The module is prompting LLM to parse the input about asset retrieval and placement."""
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 from openai import OpenAI
 
 from simworld.assets_rp.prompt.retrieval_input_prompt import \
     scene_extraction_system_prompt
+from simworld.assets_rp.utils.response_cache import ResponseCache
 
 
 class InputParser:
     """The class will parse the input and return 4 parts: asset_to_place, reference_asset_query, relation, surroundings_query."""
-    def __init__(self, model: str = 'gpt-3.5-turbo'):
+    def __init__(self, model: str = 'gpt-3.5-turbo', cache_path: str = None):
         """Initialize the model of the class.
 
         Args:
             model: the name of the model
+            cache_path: optional path to a SQLite file caching parse results, so repeated prompts skip the API call.
         """
         self.model = model
         self.client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+        self.cache = ResponseCache(cache_path) if cache_path else None
 
     def parse_input(self, prompt: str) -> dict:
         """Call OpenAI API and parse the natural language input, it will extract 4 parts: asset_to_place, reference_asset, relation, surrounding_assets.
@@ -30,17 +34,25 @@ class InputParser:
             reference_asset: "...", the reference asset
             surrounding_assets: "...", the surrounding assets user provide
         """
-        try:
-            system_message = scene_extraction_system_prompt
-            user_message = f'Extract the scene details from the following prompt:\n\n{prompt}'
+        system_message = scene_extraction_system_prompt
+        user_message = f'Extract the scene details from the following prompt:\n\n{prompt}'
+        cache_key = None
+        if self.cache is not None:
+            cache_key = ResponseCache.make_key(self.model, system_message, user_message)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
 
+        try:
             response = self.client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {'role': 'system', 'content': system_message},
                     {'role': 'user', 'content': user_message},
                 ],
-                temperature=0
+                temperature=0,
+                # JSON mode, so the reply is always a parsable object and never prose around it
+                response_format={'type': 'json_object'},
             )
             message_content = response.choices[0].message.content.strip()
 
@@ -66,6 +78,9 @@ class InputParser:
             if not isinstance(result['surrounding_assets'], str):
                 raise ValueError('surrounding_assets must be a string.')
 
+            # Only validated results are cached, a failed call is retried next time
+            if cache_key is not None:
+                self.cache.put(cache_key, result)
             return result
 
         except Exception:
@@ -75,3 +90,18 @@ class InputParser:
                 'relation': '',
                 'surrounding_assets': ''
             }
+
+    def parse_inputs(self, prompts: list, max_workers: int = 8) -> list:
+        """Parse several natural language inputs with concurrent API calls.
+
+        Args:
+            prompts: the text prompts provided by the user.
+            max_workers: the maximum number of requests in flight at once.
+
+        Returns:
+            A list with the parse_input result of every prompt, in the order of prompts.
+        """
+        if not prompts:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(prompts))) as executor:
+            return list(executor.map(self.parse_input, prompts))
@@ -3,16 +3,28 @@
 import faiss
 from sentence_transformers import SentenceTransformer
 
+from simworld.assets_rp.utils.embedding_cache import EmbeddingCache
 from simworld.utils.load_json import load_json
 
 
 class ReferenceAssetsRetriever:
     """Retrieve reference assets from a scene graph using description-based similarity."""
-    def __init__(self, progen_world_path: str, description_map_path: str, env_description_retrieval_model_name: str):
-        """Initialize relevant modules."""
+    def __init__(self, progen_world_path: str, description_map_path: str, env_description_retrieval_model_name: str, embedding_cache: EmbeddingCache = None,
+                 model: SentenceTransformer = None, nodes: list = None):
+        """Initialize relevant modules.
+
+        Args:
+            progen_world_path: the path to the world graph JSON file.
+            description_map_path: the path to the description map file.
+            env_description_retrieval_model_name: the name of the Sentence-BERT model.
+            embedding_cache: optional cache of embeddings, so node descriptions seen before are not encoded again.
+            model: optional already loaded Sentence-BERT model, used instead of loading env_description_retrieval_model_name again.
+            nodes: optional already parsed nodes of the world graph, used instead of reading progen_world_path again.
+        """
         self.progen_world_path = progen_world_path
-        self.model = SentenceTransformer(env_description_retrieval_model_name)
-        self.nodes = self._load_nodes()
+        self.model = model if model is not None else SentenceTransformer(env_description_retrieval_model_name)
+        self.embedding_cache = embedding_cache
+        self.nodes = nodes if nodes is not None else self._load_nodes()
         self.instance_desc_map = load_json(description_map_path)
         # pre-compute instance_name embedding of every node
         self.embeddings, self.node_ids = self._precompute_embeddings()
@@ -41,7 +53,11 @@ class ReferenceAssetsRetriever:
         """
         instance_names = [node.get('instance_name', '') for node in self.nodes]
         descriptions = [self.instance_desc_map.get(name, name) for name in instance_names]
-        embeddings = self.model.encode(descriptions, convert_to_numpy=True, show_progress_bar=True)
+        if self.embedding_cache is not None:
+            embeddings = self.embedding_cache.get_or_compute_many(
+                descriptions, lambda texts: self.model.encode(texts, convert_to_numpy=True, show_progress_bar=True))
+        else:
+            embeddings = self.model.encode(descriptions, convert_to_numpy=True, show_progress_bar=True)
         faiss.normalize_L2(embeddings)
         return embeddings, instance_names
 
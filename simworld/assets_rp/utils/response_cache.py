@@ -0,0 +1,59 @@
+"""This module stores LLM responses on disk so that repeated prompts skip the API call."""
+import hashlib
+import json
+import os
+import sqlite3
+from threading import Lock
+
+
+class ResponseCache:
+    """Persistent cache of JSON-serializable responses keyed by a hash of everything that determines them."""
+    def __init__(self, path: str):
+        """Open the cache, creating the database file if needed.
+
+        Args:
+            path: the path to the SQLite database file.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute('CREATE TABLE IF NOT EXISTS responses (key BLOB PRIMARY KEY, response TEXT NOT NULL)')
+        self.connection.commit()
+        self.lock = Lock()
+
+    @staticmethod
+    def make_key(*parts: str) -> bytes:
+        """Hash the parts of a request into a cache key.
+
+        Args:
+            parts: the strings that determine the response, such as the model name and the prompts.
+
+        Returns:
+            The cache key.
+        """
+        return hashlib.blake2b('\x00'.join(parts).encode('utf-8'), digest_size=16).digest()
+
+    def get(self, key: bytes):
+        """Get a cached response.
+
+        Args:
+            key: the cache key.
+
+        Returns:
+            The decoded response, or None if it is not cached.
+        """
+        with self.lock:
+            row = self.connection.execute('SELECT response FROM responses WHERE key = ?', (key,)).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def put(self, key: bytes, response):
+        """Store a response.
+
+        Args:
+            key: the cache key.
+            response: the JSON-serializable response.
+        """
+        with self.lock:
+            with self.connection:
+                self.connection.execute('INSERT OR REPLACE INTO responses (key, response) VALUES (?, ?)', (key, json.dumps(response)))
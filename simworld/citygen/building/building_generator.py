@@ -1,6 +1,7 @@
 """Building generator module for generating buildings along road segments."""
 import math
 import random
+from typing import List
 
 from simworld.citygen.building.building_manager import BuildingManager
 from simworld.citygen.dataclass.dataclass import (Bounds, Building, Point,
@@ -58,6 +59,16 @@ class BuildingGenerator:
                 return building_type
         return None
 
+    def generate_buildings_along_segments(self, segments: List[Segment], road_quadtree: QuadTree[Segment]):
+        """Generate buildings along both sides of several road segments, in order.
+
+        Args:
+            segments: Road segments to place buildings along.
+            road_quadtree: Quadtree containing all road segments.
+        """
+        for segment in segments:
+            self.generate_buildings_along_segment(segment, road_quadtree)
+
     def generate_buildings_along_segment(self, segment: Segment, road_quadtree: QuadTree[Segment]):
         """Generate buildings along both sides of a road segment.
 
@@ -111,7 +122,10 @@ class BuildingGenerator:
                 rotation = (math.degrees(math.atan2(dy, dx)) + (180 if side == 1 else 0)) % 360
                 building_bounds = Bounds(x - building_type.width / 2, y - building_type.height / 2, building_type.width, building_type.height, rotation)
 
-                if self.building_manager.can_place_building(building_bounds) and not self.check_building_road_overlap(building_bounds, road_quadtree):
+                # Each check is a quadtree query, so evaluate them once for all the branches below
+                can_place = self.building_manager.can_place_building(building_bounds)
+                overlaps_road = can_place and self.check_building_road_overlap(building_bounds, road_quadtree)
+                if can_place and not overlaps_road:
                     building = Building(
                         building_type=building_type,
                         bounds=building_bounds,
@@ -152,7 +166,7 @@ class BuildingGenerator:
                                 next_building_type = self.get_next_building_type()
                                 break
 
-                elif not self.building_manager.can_place_building(building_bounds):  # overlap with other buildings
+                elif not can_place:  # overlap with other buildings
                     if not overlap_building_flag:
                         building_type = self.get_smallest_available_building_type()
                         if building_type is None:
@@ -165,7 +179,7 @@ class BuildingGenerator:
                         if building_type is None:
                             break
                         current_pos += random.uniform(0, 1)
-                elif self.check_building_road_overlap(building_bounds, road_quadtree):  # overlap with roads
+                elif overlaps_road:  # overlap with roads
                     if not overlap_road_flag:
                         current_pos += self.config['citygen.building.building_side_distance']
                         overlap_road_flag = True
@@ -5,7 +5,7 @@ in the city's quadtree structure.
 """
 from typing import List
 
-from simworld.citygen.dataclass.dataclass import Bounds, Building
+from simworld.citygen.dataclass.dataclass import Bounds, Building, Point
 from simworld.utils.bbox_utils import BboxUtils
 from simworld.utils.quadtree import QuadTree
 
@@ -28,6 +28,7 @@ class BuildingManager:
             self.config['citygen.quadtree.max_objects'],
             self.config['citygen.quadtree.max_levels'])
         self.buildings: List[Building] = []
+        self.version = 0
 
     def can_place_building(self, bounds: Bounds, buffer: float = None) -> bool:
         """Check if a building can be placed at the specified location.
@@ -59,6 +60,18 @@ class BuildingManager:
                 return False
         return True
 
+    def nearest_k(self, position: Point, k: int) -> List[Building]:
+        """Get the buildings closest to a position.
+
+        Args:
+            position: Position to search around.
+            k: Number of buildings to return.
+
+        Returns:
+            Up to k buildings, nearest first by the distance to their bounds.
+        """
+        return self.building_quadtree.nearest(position.x, position.y, k)
+
     def add_building(self, building: Building):
         """Add new building to manager.
 
@@ -66,6 +79,7 @@ class BuildingManager:
             building: Building to add.
         """
         self.buildings.append(building)
+        self.version += 1
         # To be added to quadtree later
         self.building_quadtree.insert(building.bounds, building)
 
@@ -76,6 +90,7 @@ class BuildingManager:
             building: Building to remove.
         """
         self.buildings.remove(building)
+        self.version += 1
         self.building_quadtree.remove(building.bounds, building)
 
     def rebuild_quadtree(self):
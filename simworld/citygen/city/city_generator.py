@@ -137,7 +137,9 @@ class CityGenerator:
                     self.element_generator.generate_elements_on_road_multithread(segments)
                     self.current_element_segment_index += min(thread_num, len(self.roads) - self.current_element_segment_index)
                 else:
-                    pass
+                    segment = self.roads[self.current_element_segment_index]
+                    self.element_generator.generate_elements_on_road(segment)
+                    self.current_element_segment_index += 1
                 return False
             else:
                 self.generation_state = GenerationState.GENERATING_ROUTES
@@ -226,6 +228,15 @@ class CityGenerator:
         """
         return [self.road_quadtree, self.building_quadtree, self.element_quadtree]
 
+    @property
+    def version(self):
+        """Get a counter that changes whenever roads, buildings, elements or routes change.
+
+        Returns:
+            int: Sum of the mutation counters of all managers.
+        """
+        return self.road_manager.version + self.building_manager.version + self.element_manager.version + self.route_manager.version
+
     @property
     def roads(self):
         """Get all roads.
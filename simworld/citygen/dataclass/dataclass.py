@@ -1,10 +1,15 @@
 """Module for data classes defining various data structures for city generation."""
 import math
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import List
 
 
-@dataclass
+def _reduce_to_init_args(self):
+    """Pickle through the constructor, so the cached hash is recomputed under the loading process' string hash seed."""
+    return type(self), tuple(getattr(self, f.name) for f in fields(self) if f.init)
+
+
+@dataclass(slots=True)
 class Point:
     """A point in a 2D plane."""
     x: float
@@ -29,7 +34,7 @@ class MetaInfo:
     t: float = 0.0
 
 
-@dataclass(frozen=True, eq=True)
+@dataclass(frozen=True, eq=True, slots=True)
 class Bounds:
     """A bounding box with x, y, width, height, and rotation.
 
@@ -42,10 +47,17 @@ class Bounds:
     width: float
     height: float
     rotation: float = 0.0
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Precompute the hash, the bounds are immutable and hashed on every quadtree and set lookup."""
+        object.__setattr__(self, '_hash', hash((self.x, self.y, self.width, self.height)))
 
     def __hash__(self):
         """Return the hash value of the bounds."""
-        return hash((self.x, self.y, self.width, self.height))
+        return self._hash
+
+    __reduce__ = _reduce_to_init_args
 
     def to_dict(self):
         """Convert the bounds to dictionary representation."""
@@ -65,19 +77,18 @@ class Bounds:
                     self.y > other.y + other.height)
 
 
-@dataclass
+@dataclass(slots=True)
 class Segment:
     """A road segment connecting two points."""
     start: Point
     end: Point
     q: MetaInfo = field(default_factory=MetaInfo)
     bounds: Bounds = Bounds(0, 0, 0, 0)
+    _angle: float = field(init=False, repr=False, compare=False)
 
     def get_angle(self) -> float:
-        """Calculate the angle of the segment in degrees."""
-        dx = self.end.x - self.start.x
-        dy = self.end.y - self.start.y
-        return math.degrees(math.atan2(dy, dx))
+        """Get the angle of the segment in degrees."""
+        return self._angle
 
     def to_dict(self):
         """Convert the segment to dictionary representation."""
@@ -86,10 +97,28 @@ class Segment:
             'end': self.end.to_dict()
         }
 
+    def set_endpoints(self, start: Point, end: Point):
+        """Move the segment, recomputing its angle and bounds.
+
+        Args:
+            start: The new start point.
+            end: The new end point.
+        """
+        self.start = start
+        self.end = end
+        self._update_geometry()
+
     def __post_init__(self):
-        """Calculates segment length, sets width, creates Bounds object after Segment initialization."""
+        """Calculates segment angle and length, sets width, creates Bounds object after Segment initialization."""
+        self._update_geometry()
+
+    def _update_geometry(self):
         width = 50
-        length = ((self.end.x - self.start.x) ** 2 + (self.end.y - self.start.y) ** 2) ** 0.5
+        dx = self.end.x - self.start.x
+        dy = self.end.y - self.start.y
+        # The angle is read on every road and intersection query, so it is computed only when the endpoints change
+        self._angle = math.degrees(math.atan2(dy, dx))
+        length = (dx ** 2 + dy ** 2) ** 0.5
         object.__setattr__(self, 'bounds', Bounds(
             self.start.x - width / 2,
             self.start.y - length / 2,
@@ -129,19 +158,24 @@ class Route:
 
 
 # Building types
-@dataclass(frozen=True, eq=True)
+@dataclass(frozen=True, eq=True, slots=True)
 class BuildingType:
     """A building type."""
     name: str
     width: float
     height: float
     num_limit: int = -1
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Precompute the hash of the building type."""
+        object.__setattr__(self, '_hash', hash((self.name, self.width, self.height, self.num_limit)))
 
     def __hash__(self):
         """Return the hash value of the building type."""
-        return hash(
-            (self.name, self.width, self.height, self.num_limit)
-        )
+        return self._hash
+
+    __reduce__ = _reduce_to_init_args
 
     def to_dict(self):
         """Convert the building type to dictionary representation."""
@@ -153,7 +187,7 @@ class BuildingType:
         }
 
 
-@dataclass(frozen=True, eq=True)
+@dataclass(frozen=True, eq=True, slots=True)
 class Building:
     """A building."""
     building_type: BuildingType
@@ -162,6 +196,7 @@ class Building:
     center: Point = field(init=False)  # Center point of the building
     width: float = field(init=False)
     height: float = field(init=False)
+    _hash: int = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Calculate center point after initialization."""
@@ -177,19 +212,26 @@ class Building:
         object.__setattr__(self, 'width', self.bounds.width)
         object.__setattr__(self, 'height', self.bounds.height)
         object.__setattr__(self, 'rotation', self.bounds.rotation)
+        object.__setattr__(
+            self,
+            '_hash',
+            hash(
+                (
+                    self.building_type.name,
+                    self.bounds.x,
+                    self.bounds.y,
+                    self.bounds.width,
+                    self.bounds.height,
+                    self.rotation,
+                )
+            )
+        )
 
     def __hash__(self):
         """Make Building hashable."""
-        return hash(
-            (
-                self.building_type.name,
-                self.bounds.x,
-                self.bounds.y,
-                self.bounds.width,
-                self.bounds.height,
-                self.rotation,
-            )
-        )
+        return self._hash
+
+    __reduce__ = _reduce_to_init_args
 
     def to_dict(self):
         """Convert the building to dictionary representation."""
@@ -201,16 +243,23 @@ class Building:
         }
 
 
-@dataclass(frozen=True, eq=True)
+@dataclass(frozen=True, eq=True, slots=True)
 class ElementType:
     """An element type."""
     name: str
     width: float
     height: float
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Precompute the hash of the element type."""
+        object.__setattr__(self, '_hash', hash((self.name, self.width, self.height)))
 
     def __hash__(self):
         """Return the hash value of the element type."""
-        return hash((self.name, self.width, self.height))
+        return self._hash
+
+    __reduce__ = _reduce_to_init_args
 
     def to_dict(self):
         """Convert the element type to dictionary representation."""
@@ -221,7 +270,7 @@ class ElementType:
         }
 
 
-@dataclass(frozen=True, eq=True)
+@dataclass(frozen=True, eq=True, slots=True)
 class Element:
     """An element is a small object that can be placed in the city."""
     element_type: ElementType
@@ -229,6 +278,7 @@ class Element:
     rotation: float = 0.0
     center: Point = field(init=False)
     building: Building = None
+    _hash: int = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Calculate center point after initialization."""
@@ -241,10 +291,13 @@ class Element:
                 self.bounds.y + self.bounds.height / 2
             )
         )
+        object.__setattr__(self, '_hash', hash((self.element_type.name, self.bounds, self.rotation, self.center)))
 
     def __hash__(self):
         """Return the hash value of the element."""
-        return hash((self.element_type.name, self.bounds, self.rotation, self.center))
+        return self._hash
+
+    __reduce__ = _reduce_to_init_args
 
     def to_dict(self):
         """Convert the element to dictionary representation."""
@@ -229,16 +229,15 @@ class ElementGenerator:
         Args:
             buildings: List of buildings to place elements around.
         """
-        with ProcessPoolExecutor(max_workers=self.config['citygen.element.generation_thread_number']) as executor:
-            # generate elements around buildings
-            future_elements = list(executor.map(self._add_elements_around_building, buildings))
+        # generate elements around buildings
+        future_elements = self._map_in_workers(self._add_elements_around_building, buildings)
 
-            # add generated elements to element manager
-            for idx, elements in enumerate(future_elements):
-                for element in elements:
-                    if self.element_manager.can_place_element(element.bounds):
-                        self.element_manager.add_element(element)
-                        self.element_to_owner[element] = buildings[idx]
+        # add generated elements to element manager
+        for idx, elements in enumerate(future_elements):
+            for element in elements:
+                if self.element_manager.can_place_element(element.bounds):
+                    self.element_manager.add_element(element)
+                    self.element_to_owner[element] = buildings[idx]
 
     def generate_elements_on_road_multithread(self, segments: List[Segment]):
         """Generate elements on roads using multiprocessing.
@@ -246,12 +245,30 @@ class ElementGenerator:
         Args:
             segments: List of road segments to place elements along.
         """
-        with ProcessPoolExecutor(max_workers=self.config['citygen.element.generation_thread_number']) as executor:
-            future_elements = list(executor.map(self._add_elements_spline_road, segments))
-            for idx, elements in enumerate(future_elements):
-                for element in elements:
-                    self.element_manager.add_element(element)
-                    self.element_to_owner[element] = segments[idx]
+        future_elements = self._map_in_workers(self._add_elements_spline_road, segments)
+        for idx, elements in enumerate(future_elements):
+            for element in elements:
+                self.element_manager.add_element(element)
+                self.element_to_owner[element] = segments[idx]
+
+    def _map_in_workers(self, func, items: list) -> list:
+        """Apply a function to each item, in worker processes when more than one is useful.
+
+        A single worker or a single item runs inline, which skips starting a process pool
+        and pickling the generator for it.
+
+        Args:
+            func: Function to apply.
+            items: Items to apply the function to.
+
+        Returns:
+            List of results in the order of the items.
+        """
+        max_workers = min(self.config['citygen.element.generation_thread_number'] or 1, len(items))
+        if max_workers <= 1:
+            return [func(item) for item in items]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(func, items))
 
     def generate_elements_around_building(self, building: Building):
         """Generate and add elements around a single building.
@@ -264,6 +281,16 @@ class ElementGenerator:
             if self.element_manager.can_place_element(element.bounds):
                 self.element_manager.add_element(element)
 
+    def generate_elements_on_road(self, segment: Segment):
+        """Generate and add elements along a single road segment.
+
+        Args:
+            segment: The road segment to place elements along.
+        """
+        for element in self._add_elements_spline_road(segment):
+            self.element_manager.add_element(element)
+            self.element_to_owner[element] = segment
+
     def filter_elements_by_buildings(self, building_quadtree: QuadTree[Building]):
         """Filter out elements that overlap with buildings.
 
@@ -20,6 +20,7 @@ class ElementManager:
         """
         self.config = config
         self.elements = []
+        self.version = 0
         self.element_quadtree = QuadTree[Element](
             Bounds(self.config['citygen.quadtree.bounds.x'], self.config['citygen.quadtree.bounds.y'], self.config['citygen.quadtree.bounds.width'], self.config['citygen.quadtree.bounds.height']),
             self.config['citygen.quadtree.max_objects'],
@@ -34,6 +35,7 @@ class ElementManager:
             element: Element to add.
         """
         self.elements.append(element)
+        self.version += 1
         self.element_quadtree.insert(element.bounds, element)
 
     def can_place_element(self, bounds: Bounds, buffer: float = None) -> bool:
@@ -68,6 +70,7 @@ class ElementManager:
         """Remove a element from the quadtree and list."""
         try:
             self.elements.remove(element)
+            self.version += 1
             self.element_quadtree.remove(element.bounds, element)
         except ValueError:
             self.logger.error(f'Element {element.element_type.name} not found in elements list')
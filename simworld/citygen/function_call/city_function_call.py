@@ -58,8 +58,7 @@ class CityFunctionCall:
         """
         StartPoint = Point(start[0], start[1])
         EndPoint = Point(end[0], end[1])
-        self.city_generator.road_manager.add_segment(Segment(StartPoint, EndPoint))
-        return len(self.city_generator.road_manager.roads) - 1
+        return self.city_generator.road_manager.add_segment(Segment(StartPoint, EndPoint))
 
     def remove_road(self, id: int) -> bool:
         """Remove a road segment from the city.
@@ -91,8 +90,7 @@ class CityFunctionCall:
         try:
             segment = self.city_generator.road_manager.get_segment_by_id(id)
             old_segment = Segment(segment.start, segment.end)
-            segment.start = Point(start[0], start[1])
-            segment.end = Point(end[0], end[1])
+            segment.set_endpoints(Point(start[0], start[1]), Point(end[0], end[1]))
             self.city_generator.road_manager.update_segment(old_segment, segment)
             return True
         except IndexError:
@@ -121,8 +119,7 @@ class CityFunctionCall:
 
     def generate_building_alone_roads(self):
         """Generate buildings along all roads in the city."""
-        for road in self.city_generator.road_manager.roads:
-            self.city_generator.building_generator.generate_buildings_along_segment(road, self.city_generator.road_manager.road_quadtree)
+        self.city_generator.building_generator.generate_buildings_along_segments(self.city_generator.road_manager.roads, self.city_generator.road_manager.road_quadtree)
         self.logger.info(f'Generated {len(self.city_generator.building_manager.buildings)} buildings')
 
     def generate_element_alone_road(self, road_id: int):
@@ -3,13 +3,15 @@
 This module provides functionality for loading city data from JSON files and
 rendering a visualization of the city layout including roads, buildings, and elements.
 """
-import random
+import zlib
 from typing import List
 
+import numpy as np
 import pyqtgraph as pg
-from PyQt5.QtCore import Qt
-from PyQt5.QtWidgets import (QApplication, QLabel, QMainWindow, QVBoxLayout,
-                             QWidget)
+from PyQt5.QtCore import QPointF, Qt
+from PyQt5.QtGui import QPainterPath, QPolygonF
+from PyQt5.QtWidgets import (QApplication, QGraphicsPathItem, QLabel,
+                             QMainWindow, QVBoxLayout, QWidget)
 
 from simworld.citygen.dataclass.dataclass import (Bounds, Building,
                                                   BuildingType, Element,
@@ -17,15 +19,49 @@ from simworld.citygen.dataclass.dataclass import (Bounds, Building,
 from simworld.config import Config
 from simworld.utils.load_json import load_json
 
+# Corners of a rectangle in units of its half sizes, in the same order as QPainterPath.addRect
+_RECT_CORNERS = np.array([(-1.0, -1.0), (1.0, -1.0), (1.0, 1.0), (-1.0, 1.0)])
+
+
+def _to_arrays(records: List[dict]):
+    """Split serialized buildings or elements into one float array and per-row type indices.
+
+    Args:
+        records: The serialized objects, each with a 'type', 'bounds' and 'rotation'.
+
+    Returns:
+        A (N, 6) float array of x, y, width, height, bounds rotation and rotation, the type names in
+        first-seen order, and an int array giving the index into those names for every row.
+    """
+    type_index = {}
+    values = np.array(
+        [(r['bounds']['x'], r['bounds']['y'], r['bounds']['width'], r['bounds']['height'], r['bounds']['rotation'], r['rotation'])
+         for r in records],
+        dtype=float,
+    ).reshape(-1, 6)
+    type_ids = np.fromiter((type_index.setdefault(r['type'], len(type_index)) for r in records), dtype=np.intp, count=len(records))
+    return values, list(type_index), type_ids
+
 
 class CityData:
-    """Container for city visualization data."""
+    """Container for city visualization data.
+
+    Buildings and elements are stored column-wise: building_bounds and element_bounds hold one row of
+    x, y, width, height, bounds rotation and rotation per object, and building_type_ids / element_type_ids
+    index into building_types / element_types.
+    """
 
     def __init__(self):
         """Initialize empty city data structures."""
         self.roads: List[dict] = []  # Using dict for roads since no Road class in custom_types
-        self.buildings: List[Building] = []
-        self.elements: List[Element] = []
+        self.building_bounds = np.zeros((0, 6))
+        self.building_types: List[str] = []
+        self.building_type_ids = np.zeros(0, dtype=np.intp)
+        self.element_bounds = np.zeros((0, 6))
+        self.element_types: List[str] = []
+        self.element_type_ids = np.zeros(0, dtype=np.intp)
+        self._buildings = None
+        self._elements = None
 
     def load_from_files(self, output_dir='output'):
         """Load city data from JSON files.
@@ -43,53 +79,57 @@ class CityData:
 
             # Load buildings
             buildings_data = load_json(buildings_path)
-            self.buildings = []
-            for b in buildings_data['buildings']:
-                building_type = BuildingType(
-                    name=b['type'],
-                    width=b['bounds']['width'],
-                    height=b['bounds']['height']
-                )
-                bounds = Bounds(
-                    x=b['bounds']['x'],
-                    y=b['bounds']['y'],
-                    width=b['bounds']['width'],
-                    height=b['bounds']['height'],
-                    rotation=b['bounds']['rotation']
-                )
-                self.buildings.append(Building(
-                    building_type=building_type,
-                    bounds=bounds,
-                    rotation=b['rotation']
-                ))
+            self.building_bounds, self.building_types, self.building_type_ids = _to_arrays(buildings_data['buildings'])
+            self._buildings = None
 
             # Load elements
             elements_data = load_json(elements_path)
-            self.elements = []
-            for e in elements_data['elements']:
-                element_type = ElementType(
-                    name=e['type'],
-                    width=e['bounds']['width'],
-                    height=e['bounds']['height']
-                )
-                bounds = Bounds(
-                    x=e['bounds']['x'],
-                    y=e['bounds']['y'],
-                    width=e['bounds']['width'],
-                    height=e['bounds']['height'],
-                    rotation=e['bounds']['rotation']
-                )
-                self.elements.append(Element(
-                    element_type=element_type,
-                    bounds=bounds,
-                    rotation=e['rotation']
-                ))
+            self.element_bounds, self.element_types, self.element_type_ids = _to_arrays(elements_data['elements'])
+            self._elements = None
 
             print('Successfully loaded city data')
 
         except Exception as e:
             print(f'Error loading city data: {e}')
 
+    @property
+    def buildings(self) -> List[Building]:
+        """Get the buildings as objects, built from the arrays on first access.
+
+        Returns:
+            list: List of buildings.
+        """
+        if self._buildings is None:
+            self._buildings = [
+                Building(
+                    building_type=BuildingType(name=self.building_types[type_id], width=width, height=height),
+                    bounds=Bounds(x=x, y=y, width=width, height=height, rotation=bounds_rotation),
+                    rotation=rotation
+                )
+                for (x, y, width, height, bounds_rotation, rotation), type_id
+                in zip(self.building_bounds.tolist(), self.building_type_ids.tolist())
+            ]
+        return self._buildings
+
+    @property
+    def elements(self) -> List[Element]:
+        """Get the elements as objects, built from the arrays on first access.
+
+        Returns:
+            list: List of elements.
+        """
+        if self._elements is None:
+            self._elements = [
+                Element(
+                    element_type=ElementType(name=self.element_types[type_id], width=width, height=height),
+                    bounds=Bounds(x=x, y=y, width=width, height=height, rotation=bounds_rotation),
+                    rotation=rotation
+                )
+                for (x, y, width, height, bounds_rotation, rotation), type_id
+                in zip(self.element_bounds.tolist(), self.element_type_ids.tolist())
+            ]
+        return self._elements
+
 
 class CityVisualizer(QMainWindow):
     """Visualization renderer for city data."""
@@ -135,6 +175,11 @@ class CityVisualizer(QMainWindow):
         self.plot_widget.setMouseEnabled(x=True, y=True)
         self.plot_widget.setMenuEnabled(False)
 
+        # Pens and brushes per building or element type, created once and reused across frames
+        self._pens = {}
+        self._brushes = {}
+        self._element_pen = pg.mkPen('w')
+
         # Initialize city data
         self.city = CityData()
         self.city.load_from_files(output_dir=config['citygen.output_dir'] if input_dir is None else input_dir)
@@ -142,6 +187,25 @@ class CityVisualizer(QMainWindow):
         # Set window size
         self.resize(1280, 960)
 
+    def _get_type_style(self, type_name: str):
+        """Get the pen and brush of a building or element type, creating them on first use.
+
+        The color is derived from a CRC32 of the type name, so a type keeps its color across frames and runs.
+
+        Args:
+            type_name: The name of the building or element type.
+
+        Returns:
+            The pen and the brush of the type.
+        """
+        if type_name not in self._brushes:
+            h = zlib.crc32(type_name.encode())
+            # Setting the high bit of every channel keeps colors light enough to stand out on the background
+            color = ((h >> 16) & 0xFF | 0x80, (h >> 8) & 0xFF | 0x80, h & 0xFF | 0x80)
+            self._pens[type_name] = pg.mkPen(color, width=2)
+            self._brushes[type_name] = pg.mkBrush(color)
+        return self._pens[type_name], self._brushes[type_name]
+
     def draw_frame(self):
         """Draw current state of the city."""
         self.plot_widget.clear()
@@ -159,90 +223,58 @@ class CityVisualizer(QMainWindow):
             else:
                 normal_roads.extend(points)
 
-        # Draw normal roads
-        if normal_roads:
-            for i in range(0, len(normal_roads), 2):
-                line = pg.PlotDataItem(
-                    x=[normal_roads[i][0], normal_roads[i + 1][0]],
-                    y=[normal_roads[i][1], normal_roads[i + 1][1]],
-                    pen=pg.mkPen('#2E5984', width=1.8),
-                    antialias=True,
-                )
-                self.plot_widget.addItem(line)
-
-        # Draw highways
-        if highways:
-            for i in range(0, len(highways), 2):
-                line = pg.PlotDataItem(
-                    x=[highways[i][0], highways[i + 1][0]],
-                    y=[highways[i][1], highways[i + 1][1]],
-                    pen=pg.mkPen('#1E3F66', width=3.0),
-                    antialias=True,
-                )
-                self.plot_widget.addItem(line)
-
-        # Generate random colors for each building type
-        building_colors = {}
-        for building in self.city.buildings:
-            building_type = building.building_type.name
-            if building_type not in building_colors:
-                # Generate random RGB values with good visibility
-                r = random.randint(100, 255)
-                g = random.randint(100, 255)
-                b = random.randint(100, 255)
-                building_colors[building_type] = f'#{r:02x}{g:02x}{b:02x}'
-
-        # Draw buildings
-        for building in self.city.buildings:
-            rect = pg.QtWidgets.QGraphicsRectItem(
-                building.bounds.x,
-                building.bounds.y,
-                building.bounds.width,
-                building.bounds.height,
-            )
+        # Draw each road category as a single item, connect='pairs' leaves a gap between consecutive roads
+        for roads, pen in ((normal_roads, pg.mkPen('#2E5984', width=1.8)), (highways, pg.mkPen('#1E3F66', width=3.0))):
+            if roads:
+                points = np.asarray(roads, dtype=float)
+                self.plot_widget.addItem(pg.PlotCurveItem(x=points[:, 0], y=points[:, 1], connect='pairs', pen=pen, antialias=True))
+
+        # Corners of every building rectangle rotated around its own center, computed for all buildings at once
+        bounds = self.city.building_bounds
+        half_sizes = bounds[:, 2:4] / 2
+        centers = bounds[:, 0:2] + half_sizes
+        angles = np.radians(bounds[:, 4])[:, None]
+        offsets = _RECT_CORNERS[None, :, :] * half_sizes[:, None, :]
+        corners = np.stack(
+            (
+                centers[:, None, 0] + offsets[..., 0] * np.cos(angles) - offsets[..., 1] * np.sin(angles),
+                centers[:, None, 1] + offsets[..., 0] * np.sin(angles) + offsets[..., 1] * np.cos(angles),
+            ),
+            axis=-1,
+        )
 
-            rect.setTransformOriginPoint(
-                building.bounds.x + building.bounds.width / 2,
-                building.bounds.y + building.bounds.height / 2,
-            )
-            rect.setRotation(building.rotation)
-
-            building_type = building.building_type.name
-            color = building_colors[building_type]
-            rect.setPen(pg.mkPen(color, width=2))
-            rect.setBrush(pg.mkBrush(color))
-            self.plot_widget.addItem(rect)
-
-        # Generate random colors for each element type
-        element_colors = {}
-        for element in self.city.elements:
-            element_type = element.element_type.name
-            if element_type not in element_colors:
-                # Generate random RGB values with good visibility
-                r = random.randint(100, 255)
-                g = random.randint(100, 255)
-                b = random.randint(100, 255)
-                element_colors[element_type] = f'#{r:02x}{g:02x}{b:02x}'
-
-        # Draw elements
-        for element in self.city.elements:
-            size = min(element.bounds.width, element.bounds.height) * 1
-            element_type = element.element_type.name
-            color = element_colors[element_type]
-
-            circle = pg.ScatterPlotItem(
-                pos=[(element.center.x, element.center.y)],
-                size=size,
-                pen=pg.mkPen('w'),  # White border
-                brush=pg.mkBrush(color),
+        # Draw all buildings of a type as one path item
+        for type_id, building_type in enumerate(self.city.building_types):
+            path = QPainterPath()
+            # Overlapping buildings stay filled instead of cancelling out
+            path.setFillRule(Qt.WindingFill)
+            for polygon in corners[self.city.building_type_ids == type_id].tolist():
+                path.addPolygon(QPolygonF([QPointF(x, y) for x, y in polygon]))
+                path.closeSubpath()
+
+            pen, brush = self._get_type_style(building_type)
+            item = QGraphicsPathItem(path)
+            item.setPen(pen)
+            item.setBrush(brush)
+            self.plot_widget.addItem(item)
+
+        # Draw all elements of a type as one scatter item, sized by the shorter side of their bounds
+        for type_id, element_type in enumerate(self.city.element_types):
+            rows = self.city.element_bounds[self.city.element_type_ids == type_id]
+            circles = pg.ScatterPlotItem(
+                x=rows[:, 0] + rows[:, 2] / 2,
+                y=rows[:, 1] + rows[:, 3] / 2,
+                size=np.minimum(rows[:, 2], rows[:, 3]),
+                pen=self._element_pen,  # White border
+                brush=self._get_type_style(element_type)[1],
                 symbol='o',
                 antialias=True,
                 pxMode=False
             )
-            self.plot_widget.addItem(circle)
+            self.plot_widget.addItem(circles)
 
         # Update status bar information
-        stats_text = f'ROADS: {len(self.city.roads)} | BUILDINGS: {len(self.city.buildings)} | ELEMENTS: {len(self.city.elements)}'
+        stats_text = f'ROADS: {len(self.city.roads)} | BUILDINGS: {len(self.city.building_bounds)} | ELEMENTS: {len(self.city.element_bounds)}'
         self.title_label.setText(stats_text)
 
 
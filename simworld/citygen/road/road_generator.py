@@ -327,3 +327,4 @@ class RoadGenerator:
                 if len(connected_segments) > 1:
                     self.road_manager.intersections.append(Intersection(point, connected_segments))
                 processed_points.add(point_key)
+        self.road_manager.version += 1
@@ -3,7 +3,7 @@
 This module provides functionality for managing road segments, including spatial indexing,
 conflict detection, and intersection identification.
 """
-from typing import List
+from typing import Dict, List
 
 from simworld.citygen.dataclass.dataclass import Bounds, Intersection, Segment
 from simworld.utils.math_utils import MathUtils
@@ -18,6 +18,12 @@ class RoadManager:
         # Core data structures
         self.roads: List[Segment] = []
         self.intersections: List[Intersection] = []
+        # Bumped on every mutation so renderers can skip unchanged frames
+        self.version = 0
+        # Stable IDs, so removing a road does not shift the IDs of the others
+        self._segments_by_id: Dict[int, Segment] = {}
+        self._segment_ids: Dict[int, int] = {}  # id(segment) -> segment ID
+        self._next_segment_id = 0
 
         # Configuration
         self.config = config
@@ -31,12 +37,23 @@ class RoadManager:
             self.config['citygen.quadtree.max_levels']
         )
 
-    def add_segment(self, segment: Segment) -> None:
-        """Add a road segment to the network."""
+    def add_segment(self, segment: Segment) -> int:
+        """Add a road segment to the network.
+
+        Returns:
+            The ID of the segment, valid until the segment is removed.
+        """
         self.roads.append(segment)
+        self.version += 1
         bounds = self._create_bounds_for_segment(segment)
         self.road_quadtree.insert(bounds, segment)
 
+        segment_id = self._next_segment_id
+        self._next_segment_id += 1
+        self._segments_by_id[segment_id] = segment
+        self._segment_ids[id(segment)] = segment_id
+        return segment_id
+
     def can_place_segment(self, segment: Segment) -> bool:
         """Check if a segment can be placed without conflicts."""
         if self.config['citygen.road.ignore_conflicts']:
@@ -84,12 +101,24 @@ class RoadManager:
     def remove_segment(self, segment: Segment) -> None:
         """Remove a road segment from the network."""
         self.roads.remove(segment)
+        self.version += 1
         bounds = self._create_bounds_for_segment(segment)
         self.road_quadtree.remove(bounds, segment)
 
+        segment_id = self._segment_ids.pop(id(segment), None)
+        if segment_id is not None:
+            del self._segments_by_id[segment_id]
+
     def get_segment_by_id(self, id: int) -> Segment:
-        """Get a road segment by its ID."""
-        return self.roads[id]
+        """Get a road segment by its ID.
+
+        Raises:
+            IndexError: If no segment has this ID.
+        """
+        try:
+            return self._segments_by_id[id]
+        except KeyError:
+            raise IndexError(f'No road segment with ID {id}') from None
 
     def update_segment(self, old_segment: Segment, new_segment: Segment) -> None:
         """Update a road segment's position in the spatial index."""
@@ -98,6 +127,7 @@ class RoadManager:
 
         new_bounds = self._create_bounds_for_segment(new_segment)
         self.road_quadtree.insert(new_bounds, new_segment)
+        self.version += 1
 
     def rebuild_quadtree(self):
         """Rebuild the quadtree."""
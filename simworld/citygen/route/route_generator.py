@@ -4,6 +4,7 @@ This module handles the creation of travel routes based on road segments and poi
 in the generated city, providing navigation paths for the simulation.
 """
 import random
+from collections import Counter
 from typing import List
 
 from simworld.citygen.dataclass.dataclass import (Bounds, Building, Element,
@@ -91,22 +92,23 @@ class RouteGenerator:
         """
         bounds = Bounds(point.x - distance, point.y - distance, 2 * distance, 2 * distance)
 
-        neighbors = []
-        for quadtree in quadtrees:
-            nodes = quadtree.retrieve(bounds)
-            neighbors += nodes
-
-        # Count different types of neighbors
-        elements = [neighbor for neighbor in neighbors if isinstance(neighbor, Element)][:k]
-        buildings = [neighbor for neighbor in neighbors if isinstance(neighbor, Building)][:k]
+        # Classify the first k elements and buildings in a single pass over the neighbors
         # Not using segments in the current implementation
-        # segments = [neighbor for neighbor in neighbors if isinstance(neighbor, Segment)][:k]
-
-        element_types = [element.element_type for element in elements]
-        # Not using building_types in the current implementation
-        # building_types = [building.building_type for building in buildings]
-
-        element_stats = {element_type.name: element_types.count(element_type) for element_type in element_types}
+        elements = []
+        buildings = []
+        for quadtree in quadtrees:
+            for neighbor in quadtree.retrieve(bounds):
+                if isinstance(neighbor, Element):
+                    if len(elements) < k:
+                        elements.append(neighbor)
+                elif isinstance(neighbor, Building):
+                    if len(buildings) < k:
+                        buildings.append(neighbor)
+            if len(elements) == k and len(buildings) == k:
+                break
+
+        # Counter keeps the first-seen order of the element types, like the stats did before
+        element_stats = dict(Counter(element.element_type.name for element in elements))
 
         building_stats = {building.building_type.name: MathUtils.get_direction_description_for_points(point, building.center) for building in buildings}
 
@@ -18,6 +18,7 @@ class RouteManager:
         Initializes an empty list to store routes.
         """
         self.routes = []
+        self.version = 0
 
     def add_route_points(self, points: List[Point]):
         """Add a route with points.
@@ -30,3 +31,4 @@ class RouteManager:
         route = Route(points, start, end)
 
         self.routes.append(route)
+        self.version += 1
@@ -16,6 +16,11 @@ from simworld.utils.load_json import load_json
 from simworld.utils.logger import Logger
 from simworld.utils.vector import Vector
 
+# Patterns for the information strings reported by the UE manager, keyed by object name
+_LOCATION_PATTERN = re.compile(r'(GEN_BP_[A-Za-z]+_\d+)X=(.*?) Y=(.*?) Z=')
+_ROTATION_PATTERN = re.compile(r'(GEN_BP_[A-Za-z]+_\d+)P=.*? Y=(.*?) R=')
+_LIGHT_STATE_PATTERN = re.compile(r'(GEN_BP_[A-Za-z]+_\d+)(true|false)(true|false)(\d+\.\d+)')
+
 
 class Communicator:
     """Class for communicating with Unreal Engine through UnrealCV.
@@ -302,6 +307,15 @@ class Communicator:
         name = self.get_pedestrian_name(pedestrian_id)
         self.unrealcv.p_stop(name)
 
+    def pedestrian_actions_batch(self, actions):
+        """Send stop, move forward and rotate actions of many pedestrians in one request.
+
+        Args:
+            actions: List of (pedestrian_id, action, args) tuples, where action is 'stop', 'move_forward'
+                or 'rotate', and args holds the angle and direction of a rotation.
+        """
+        self.unrealcv.p_actions_batch([(self.get_pedestrian_name(pedestrian_id), action, args) for pedestrian_id, action, args in actions])
+
     def set_pedestrian_speed(self, pedestrian_id, speed):
         """Set pedestrian speed.
 
@@ -434,92 +448,50 @@ class Communicator:
         info = json.loads(self.unrealcv.get_informations(self.ue_manager_name))
         result = {}
 
-        # Process vehicles
-        locations = info['VLocations']
-        rotations = info['VRotations']
-        for vehicle_id in vehicle_ids:
-            name = self.get_vehicle_name(vehicle_id)
-
-            # Parse location
-            location_pattern = f'{name}X=(.*?) Y=(.*?) Z='
-            match = re.search(location_pattern, locations)
-            if match:
-                x, y = float(match.group(1)), float(match.group(2))
-                position = Vector(x, y)
+        self._parse_poses(info['VLocations'], info['VRotations'], 'vehicle', vehicle_ids, self.get_vehicle_name, result)
+        self._parse_poses(info['PLocations'], info['PRotations'], 'pedestrian', pedestrian_ids, self.get_pedestrian_name, result)
 
-                # Parse rotation
-                rotation_pattern = f'{name}P=.*? Y=(.*?) R='
-                match = re.search(rotation_pattern, rotations)
+        # Process traffic signals
+        if traffic_signal_ids:
+            light_states = {match.group(1): match for match in _LIGHT_STATE_PATTERN.finditer(info['LStates'])}
+            for traffic_signal_id in traffic_signal_ids:
+                match = light_states.get(self.get_traffic_signal_name(traffic_signal_id))
                 if match:
-                    direction = float(match.group(1))
-                    result[('vehicle', vehicle_id)] = (position, direction)
+                    is_vehicle_green = match.group(2) == 'true'
+                    is_pedestrian_walk = match.group(3) == 'true'
+                    left_time = float(match.group(4))
 
-        # Process pedestrians
-        locations = info['PLocations']
-        rotations = info['PRotations']
-        for pedestrian_id in pedestrian_ids:
-            name = self.get_pedestrian_name(pedestrian_id)
+                    result[('traffic_signal', traffic_signal_id)] = (is_vehicle_green, is_pedestrian_walk, left_time)
 
-            location_pattern = f'{name}X=(.*?) Y=(.*?) Z='
-            match = re.search(location_pattern, locations)
-            if match:
-                x, y = float(match.group(1)), float(match.group(2))
-                position = Vector(x, y)
+        self._parse_poses(info['ALocations'], info['ARotations'], 'humanoid', humanoid_ids, self.get_humanoid_name, result)
+        self._parse_poses(info['SLocations'], info['SRotations'], 'scooter', scooter_ids, self.get_scooter_name, result)
 
-                rotation_pattern = f'{name}P=.*? Y=(.*?) R='
-                match = re.search(rotation_pattern, rotations)
-                if match:
-                    direction = float(match.group(1))
-                    result[('pedestrian', pedestrian_id)] = (position, direction)
+        return result
 
-        # Process traffic signals
-        light_states = info['LStates']
-        for traffic_signal_id in traffic_signal_ids:
-            name = self.get_traffic_signal_name(traffic_signal_id)
-            pattern = rf'{name}(true|false)(true|false)(\d+\.\d+)'
-            match = re.search(pattern, light_states)
-            if match:
-                is_vehicle_green = match.group(1) == 'true'
-                is_pedestrian_walk = match.group(2) == 'true'
-                left_time = float(match.group(3))
-
-                result[('traffic_signal', traffic_signal_id)] = (is_vehicle_green, is_pedestrian_walk, left_time)
-
-        # process humanoids
-        locations = info['ALocations']
-        rotations = info['ARotations']
-        for humanoid_id in humanoid_ids:
-            name = self.get_humanoid_name(humanoid_id)
-            location_pattern = f'{name}X=(.*?) Y=(.*?) Z='
-            match = re.search(location_pattern, locations)
-            if match:
-                x, y = float(match.group(1)), float(match.group(2))
-                position = Vector(x, y)
+    def _parse_poses(self, locations, rotations, object_type, object_ids, get_name, result):
+        """Parse positions and yaws of one object type into result.
 
-                rotation_pattern = f'{name}P=.*? Y=(.*?) R='
-                match = re.search(rotation_pattern, rotations)
-                if match:
-                    direction = float(match.group(1))
-                    result[('humanoid', humanoid_id)] = (position, direction)
-
-        # process scooters
-        locations = info['SLocations']
-        rotations = info['SRotations']
-        for scooter_id in scooter_ids:
-            name = self.get_scooter_name(scooter_id)
-            location_pattern = f'{name}X=(.*?) Y=(.*?) Z='
-            match = re.search(location_pattern, locations)
-            if match:
-                x, y = float(match.group(1)), float(match.group(2))
-                position = Vector(x, y)
+        Each information string is scanned once and indexed by object name, instead of
+        searching the whole string again for every requested id.
 
-                rotation_pattern = f'{name}P=.*? Y=(.*?) R='
-                match = re.search(rotation_pattern, rotations)
-                if match:
-                    direction = float(match.group(1))
-                    result[('scooter', scooter_id)] = (position, direction)
+        Args:
+            locations: Location string reported by the UE manager.
+            rotations: Rotation string reported by the UE manager.
+            object_type: Type key used in the result, e.g. 'vehicle'.
+            object_ids: IDs of the objects to look up.
+            get_name: Function mapping an object ID to its name in Unreal Engine.
+            result: Dictionary to fill with (position, direction) tuples.
+        """
+        if not object_ids:
+            return
 
-        return result
+        positions = {match.group(1): (match.group(2), match.group(3)) for match in _LOCATION_PATTERN.finditer(locations)}
+        yaws = {match.group(1): match.group(2) for match in _ROTATION_PATTERN.finditer(rotations)}
+        for object_id in object_ids:
+            name = get_name(object_id)
+            if name in positions and name in yaws:
+                x, y = positions[name]
+                result[(object_type, object_id)] = (Vector(float(x), float(y)), float(yaws[name]))
 
     def spawn_object(self, object_name, model_path, position, direction):
         """Spawn object.
@@ -558,28 +530,23 @@ class Communicator:
             model_path: Model path.
             type: Agent type, possible values: 'humanoid', 'dog', ...
         """
+        self.spawn_agents([agent], model_path, type)
+
+    def spawn_agents(self, agents, model_path, type='humanoid'):
+        """Spawn several agents with one batched request.
+
+        Args:
+            agents: List of agent objects.
+            model_path: Model path.
+            type: Agent type, possible values: 'humanoid', 'dog', ...
+        """
         if type == 'humanoid':
-            name = self.get_humanoid_name(agent.id)
+            get_name = self.get_humanoid_name
         else:
             raise ValueError(f'Not supported agent type: {type}')
-        self.unrealcv.spawn_bp_asset(model_path, name)
-        # Convert 2D position to 3D (x,y -> x,y,z)
-        location_3d = (
-            agent.position.x,  # Unreal X = 2D Y
-            agent.position.y,  # Unreal Y = 2D X
-            110  # Z coordinate (ground level)
-        )
-        # Convert 2D direction to 3D orientation (assuming rotation around Z axis)
-        orientation_3d = (
-            0,  # Pitch
-            math.degrees(math.atan2(agent.direction.y, agent.direction.x)),  # Yaw
-            0  # Roll
-        )
-        self.unrealcv.set_location(location_3d, name)
-        self.unrealcv.set_orientation(orientation_3d, name)
-        self.unrealcv.set_scale((1, 1, 1), name)  # Default scale
-        self.unrealcv.set_collision(name, True)
-        self.unrealcv.set_movable(name, True)
+        self.unrealcv.spawn_bp_assets_batch([
+            (model_path, get_name(agent.id), *self._spawn_pose(agent, 110), True, True) for agent in agents
+        ])
 
     def spawn_scooter(self, scooter, model_path):
         """Spawn scooter.
@@ -588,25 +555,9 @@ class Communicator:
             scooter: Scooter object.
             model_path: Model path.
         """
-        name = self.get_scooter_name(scooter.id)
-        self.unrealcv.spawn_bp_asset(model_path, name)
-        # Convert 2D position to 3D (x,y -> x,y,z)
-        location_3d = (
-            scooter.position.x,  # Unreal X = 2D Y
-            scooter.position.y,  # Unreal Y = 2D X
-            0  # Z coordinate (ground level)
-        )
-        # Convert 2D direction to 3D orientation (assuming rotation around Z axis)
-        orientation_3d = (
-            0,  # Pitch
-            math.degrees(math.atan2(scooter.direction.y, scooter.direction.x)),  # Yaw
-            0  # Roll
-        )
-        self.unrealcv.set_location(location_3d, name)
-        self.unrealcv.set_orientation(orientation_3d, name)
-        self.unrealcv.set_scale((1, 1, 1), name)  # Default scale
-        self.unrealcv.set_collision(name, True)
-        self.unrealcv.set_movable(name, True)
+        self.unrealcv.spawn_bp_assets_batch([
+            (model_path, self.get_scooter_name(scooter.id), *self._spawn_pose(scooter, 0), True, True)
+        ])
 
     def spawn_vehicles(self, vehicles):
         """Spawn vehicles.
@@ -614,26 +565,10 @@ class Communicator:
         Args:
             vehicles: List of vehicle objects.
         """
-        for vehicle in vehicles:
-            name = self.get_vehicle_name(vehicle.id)
-            self.unrealcv.spawn_bp_asset(vehicle.vehicle_reference, name)
-            # Convert 2D position to 3D (x,y -> x,y,z)
-            location_3d = (
-                vehicle.position.x,  # Unreal X = 2D Y
-                vehicle.position.y,  # Unreal Y = 2D X
-                0  # Z coordinate (ground level)
-            )
-            # Convert 2D direction to 3D orientation (assuming rotation around Z axis)
-            orientation_3d = (
-                0,  # Pitch
-                math.degrees(math.atan2(vehicle.direction.y, vehicle.direction.x)),  # Yaw
-                0  # Roll
-            )
-            self.unrealcv.set_location(location_3d, name)
-            self.unrealcv.set_orientation(orientation_3d, name)
-            self.unrealcv.set_scale((1, 1, 1), name)  # Default scale
-            self.unrealcv.set_collision(name, True)
-            self.unrealcv.set_movable(name, True)
+        self.unrealcv.spawn_bp_assets_batch([
+            (vehicle.vehicle_reference, self.get_vehicle_name(vehicle.id), *self._spawn_pose(vehicle, 0), True, True)
+            for vehicle in vehicles
+        ])
 
     def spawn_pedestrians(self, pedestrians, model_path):
         """Spawn pedestrians.
@@ -642,26 +577,10 @@ class Communicator:
             pedestrians: List of pedestrian objects.
             model_path: Pedestrian model path.
         """
-        for pedestrian in pedestrians:
-            name = self.get_pedestrian_name(pedestrian.id)
-            self.unrealcv.spawn_bp_asset(model_path, name)
-            # Convert 2D position to 3D (x,y -> x,y,z)
-            location_3d = (
-                pedestrian.position.x,  # Unreal X = 2D Y
-                pedestrian.position.y,  # Unreal Y = 2D X
-                110  # Z coordinate (ground level)
-            )
-            # Convert 2D direction to 3D orientation (assuming rotation around Z axis)
-            orientation_3d = (
-                0,  # Pitch
-                math.degrees(math.atan2(pedestrian.direction.y, pedestrian.direction.x)),  # Yaw
-                0  # Roll
-            )
-            self.unrealcv.set_location(location_3d, name)
-            self.unrealcv.set_orientation(orientation_3d, name)
-            self.unrealcv.set_scale((1, 1, 1), name)  # Default scale
-            self.unrealcv.set_collision(name, True)
-            self.unrealcv.set_movable(name, True)
+        self.unrealcv.spawn_bp_assets_batch([
+            (model_path, self.get_pedestrian_name(pedestrian.id), *self._spawn_pose(pedestrian, 110), True, True)
+            for pedestrian in pedestrians
+        ])
 
     def spawn_traffic_signals(self, traffic_signals, traffic_light_model_path, pedestrian_light_model_path):
         """Spawn traffic signals.
@@ -671,30 +590,27 @@ class Communicator:
             traffic_light_model_path: Path to the traffic light model asset.
             pedestrian_light_model_path: Path to the pedestrian signal light model asset.
         """
+        assets = []
         for traffic_signal in traffic_signals:
-            name = self.get_traffic_signal_name(traffic_signal.id)
             if traffic_signal.type == 'pedestrian':
                 model_name = pedestrian_light_model_path
             elif traffic_signal.type == 'both':
                 model_name = traffic_light_model_path
-            self.unrealcv.spawn_bp_asset(model_name, name)
-            # Convert 2D position to 3D (x,y -> x,y,z)
-            location_3d = (
-                traffic_signal.position.x,
-                traffic_signal.position.y,
-                0  # Z coordinate (ground level)
-            )
-            # Convert 2D direction to 3D orientation (assuming rotation around Z axis)
-            orientation_3d = (
-                0,  # Pitch
-                math.degrees(math.atan2(traffic_signal.direction.y, traffic_signal.direction.x)),  # Yaw
-                0  # Roll
-            )
-            self.unrealcv.set_location(location_3d, name)
-            self.unrealcv.set_orientation(orientation_3d, name)
-            self.unrealcv.set_scale((1, 1, 1), name)  # Default scale
-            self.unrealcv.set_collision(name, True)
-            self.unrealcv.set_movable(name, False)
+            assets.append((model_name, self.get_traffic_signal_name(traffic_signal.id), *self._spawn_pose(traffic_signal, 0), True, False))
+        self.unrealcv.spawn_bp_assets_batch(assets)
+
+    @staticmethod
+    def _spawn_pose(obj, z):
+        """Convert an object's 2D position and direction into a 3D location and orientation.
+
+        Args:
+            obj: Object with position and direction vectors.
+            z: Z coordinate of the location.
+
+        Returns:
+            Tuple of location (x, y, z) and orientation (pitch, yaw, roll), rotating around the Z axis only.
+        """
+        return (obj.position.x, obj.position.y, z), (0, math.degrees(math.atan2(obj.direction.y, obj.direction.x)), 0)
 
     def spawn_waypoint_mark(self, waypoints, model_path):
         """Spawn waypoint marks.
@@ -95,6 +95,28 @@ class UnrealCV(object):
         with self.lock:
             self.client.request(cmd)
 
+    def spawn_bp_assets_batch(self, assets):
+        """Spawn blueprint assets with unit scale and set their pose in one batched request.
+
+        Args:
+            assets: List of (prefab_path, name, location, orientation, hasCollision, isMovable) tuples,
+                with location as [x, y, z] and orientation as [pitch, yaw, roll].
+        """
+        cmds = []
+        for prefab_path, name, (x, y, z), (pitch, yaw, roll), has_collision, is_movable in assets:
+            cmds.extend([
+                f'vset /objects/spawn_bp_asset {prefab_path} {name}',
+                f'vset /object/{name}/location {x} {y} {z}',
+                f'vset /object/{name}/rotation {pitch} {yaw} {roll}',
+                f'vset /object/{name}/scale 1 1 1',
+                f'vset /object/{name}/collision {has_collision}',
+                f'vset /object/{name}/object_mobility {is_movable}',
+            ])
+        if not cmds:
+            return
+        with self.lock:
+            self.client.request_batch(cmds)
+
     def clean_garbage(self):
         """Clean garbage objects."""
         with self.lock:
@@ -397,7 +419,7 @@ class UnrealCV(object):
         Args:
             object_name: Object name.
         """
-        cmd = f'vbp {object_name} StopPedestrian'
+        cmd = self._p_stop_cmd(object_name)
         with self.lock:
             self.client.request(cmd)
 
@@ -407,7 +429,7 @@ class UnrealCV(object):
         Args:
             object_name: Object name.
         """
-        cmd = f'vbp {object_name} MoveForward'
+        cmd = self._p_move_forward_cmd(object_name)
         with self.lock:
             self.client.request(cmd)
 
@@ -419,14 +441,44 @@ class UnrealCV(object):
             angle: Angle.
             direction: Direction, defaults to 'left'.
         """
+        cmd = self._p_rotate_cmd(object_name, angle, direction)
+        with self.lock:
+            self.client.request(cmd)
+
+    def p_actions_batch(self, actions):
+        """Send stop, move forward and rotate actions of many pedestrians in one batched request.
+
+        Args:
+            actions: List of (object_name, action, args) tuples, where action is 'stop', 'move_forward'
+                or 'rotate', and args holds the angle and direction of a rotation.
+        """
+        builders = {
+            'stop': self._p_stop_cmd,
+            'move_forward': self._p_move_forward_cmd,
+            'rotate': self._p_rotate_cmd,
+        }
+        cmds = [builders[action](object_name, *args) for object_name, action, args in actions]
+        if not cmds:
+            return
+        with self.lock:
+            self.client.request_batch(cmds)
+
+    @staticmethod
+    def _p_stop_cmd(object_name):
+        return f'vbp {object_name} StopPedestrian'
+
+    @staticmethod
+    def _p_move_forward_cmd(object_name):
+        return f'vbp {object_name} MoveForward'
+
+    @staticmethod
+    def _p_rotate_cmd(object_name, angle, direction='left'):
         if direction == 'right':
             clockwise = 1
         elif direction == 'left':
             angle = -angle
             clockwise = -1
-        cmd = f'vbp {object_name} Rotate_Angle {1} {angle} {clockwise}'
-        with self.lock:
-            self.client.request(cmd)
+        return f'vbp {object_name} Rotate_Angle {1} {angle} {clockwise}'
 
     def p_set_speed(self, object_name, speed):
         """Set pedestrian speed.
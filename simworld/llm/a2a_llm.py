@@ -14,6 +14,11 @@ from simworld.utils.logger import Logger
 
 from .base_llm import BaseLLM
 
+# Content from the first { to the last } of a reply
+_JSON_OBJECT_PATTERN = re.compile(r'(\{.*\})', re.DOTALL)
+# Backslashes that do not start a valid JSON escape sequence
+_INVALID_ESCAPE_PATTERN = re.compile(r'\\(?!["\\/bfnrt]|u[0-9a-fA-F]{4})')
+
 
 class A2ALLM(BaseLLM):
     """Local Planner (Activity to Action) LLM class for handling interactions with language models."""
@@ -34,6 +39,10 @@ class A2ALLM(BaseLLM):
             temperature (float): The temperature for the Local Planner system.
             top_p (float): The top_p for the Local Planner system.
             response_format (BaseModel): The response format for the Local Planner system.
+
+        Returns:
+            tuple: The response and the call time. With OpenAI the response is a parsed
+                response_format instance, with OpenRouter it is the decoded JSON.
         """
         if self.provider == 'openai':
             return self._generate_instructions_openai(system_prompt, user_prompt, images, max_tokens, temperature, top_p, response_format)
@@ -64,12 +73,13 @@ class A2ALLM(BaseLLM):
                 top_p=top_p,
                 response_format=response_format,
             )
-            action_json = response.choices[0].message.content
+            # The SDK already decoded and validated the reply into response_format, so hand that over directly
+            action = response.choices[0].message.parsed
         except Exception as e:
             self.logger.error(f'Error in generate_instructions_openai: {e}')
-            action_json = None
+            action = None
 
-        return action_json, time.time() - start_time
+        return action, time.time() - start_time
 
     def _generate_instructions_openrouter(self, system_prompt, user_prompt, images=[], max_tokens=None, temperature=0.7, top_p=1.0, response_format=BaseModel):
 
@@ -136,14 +146,21 @@ class A2ALLM(BaseLLM):
         return img_str
 
     def _extract_json_and_fix_escapes(self, text):
+        # Most replies are plain JSON objects, which need no extraction or escape fixing
+        try:
+            json_obj = json.loads(text)
+            if isinstance(json_obj, dict):
+                return json_obj
+        except json.JSONDecodeError:
+            pass
+
         # Extract content from first { to last }
-        pattern = r'(\{.*\})'
-        match = re.search(pattern, text, re.DOTALL)
+        match = _JSON_OBJECT_PATTERN.search(text)
 
         if match:
             json_str = match.group(1)
             # Fix invalid escape sequences in JSON
-            fixed_json = re.sub(r'\\(?!["\\/bfnrt]|u[0-9a-fA-F]{4})', r'\\\\', json_str)
+            fixed_json = _INVALID_ESCAPE_PATTERN.sub(r'\\\\', json_str)
             try:
                 # Try to parse the fixed JSON
                 json_obj = json.loads(fixed_json)
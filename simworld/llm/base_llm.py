@@ -3,6 +3,7 @@
 import inspect
 import os
 import time
+from threading import Lock
 from typing import Optional
 
 import openai
@@ -11,6 +12,34 @@ from simworld.utils.logger import Logger
 
 from .retry import retry_api_call
 
+# Clients shared by every LLM instance that uses the same API key and URL, so
+# agents reuse one HTTP connection pool and the key is only validated once
+_clients = {}
+_clients_lock = Lock()
+
+
+def _get_client(api_key: str, url: Optional[str]) -> openai.OpenAI:
+    """Get the shared OpenAI client for an API key and URL, creating it on first use.
+
+    Args:
+        api_key: API key of the provider.
+        url: Base URL for the API. If None, uses OpenAI's default URL.
+
+    Returns:
+        The shared OpenAI client.
+    """
+    with _clients_lock:
+        client = _clients.get((api_key, url))
+        if client is None:
+            client = openai.OpenAI(
+                api_key=api_key,
+                base_url=url,
+            )
+            # validate the api key
+            client.models.list()
+            _clients[(api_key, url)] = client
+        return client
+
 
 class LLMMetaclass(type):
     """Metaclass to automatically add retry decorators to public methods."""
@@ -66,12 +95,7 @@ class BaseLLM(metaclass=LLMMetaclass):
             url = None
 
         try:
-            self.client = openai.OpenAI(
-                api_key=self.api_key,
-                base_url=url,
-            )
-            # validate the api key
-            self.client.models.list()
+            self.client = _get_client(self.api_key, url)
         except Exception as e:
             raise ValueError(f'Failed to initialize OpenAI client: {str(e)}')
 
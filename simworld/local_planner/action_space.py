@@ -11,6 +11,16 @@ from simworld.utils.vector import Vector
 
 logger = Logger.get_logger('ActionSpace')
 
+# Values used by LowLevelActionSpace.from_json for keys missing from the response
+_LOW_LEVEL_DEFAULTS = {
+    'choice': 0,
+    'duration': 0,
+    'direction': 0,
+    'angle': 0,
+    'clockwise': True,
+    'reasoning': None,
+}
+
 
 class HighLevelAction(Enum):
     """High-level actions that an agent can perform."""
@@ -87,7 +97,9 @@ class LowLevelActionSpace(BaseModel):
 
     @classmethod
     def from_json(cls, json_str):
-        """Parse the action space from a json string."""
+        """Parse the action space from a json string, a decoded dict, or an already parsed action space."""
+        if isinstance(json_str, cls):
+            return json_str
         if isinstance(json_str, str):
             try:
                 json_str = json.loads(json_str)
@@ -95,13 +107,7 @@ class LowLevelActionSpace(BaseModel):
                 logger.warning(f'Parse action space from json failed: {e}, using default action: DO_NOTHING')
                 return cls()
         try:
-            choice = json_str.get('choice', 0)
-            duration = json_str.get('duration', 0) if json_str.get('duration', 0) is not None else None
-            direction = json_str.get('direction', 0) if json_str.get('direction', 0) is not None else None
-            angle = json_str.get('angle', 0) if json_str.get('angle', 0) is not None else None
-            clockwise = json_str.get('clockwise', True) if json_str.get('clockwise', True) is not None else None
-            reasoning = json_str.get('reasoning', None) if json_str.get('reasoning', None) is not None else None
-            return cls(choice=choice, duration=duration, direction=direction, angle=angle, clockwise=clockwise, reasoning=reasoning)
+            return cls.model_validate({field: json_str.get(field, default) for field, default in _LOW_LEVEL_DEFAULTS.items()})
         except Exception as e:
             logger.warning(f'Parse action space from json failed: {e}, using default action: DO_NOTHING')
             return cls()
@@ -144,7 +150,9 @@ class HighLevelActionSpace(BaseModel):
 
     @classmethod
     def from_json(cls, json_str):
-        """Parse the action space from a json string."""
+        """Parse the action space from a json string, a decoded dict, or an already parsed action space."""
+        if isinstance(json_str, cls):
+            return json_str
         if isinstance(json_str, str):
             try:
                 json_str = json.loads(json_str)
@@ -152,11 +160,17 @@ class HighLevelActionSpace(BaseModel):
                 logger.warning(f'Parse action space from json failed: {e}, using default action: DO_NOTHING')
                 return cls()
         try:
-            destination = Vector(json_str.get('destination', [0, 0])) if json_str.get('destination', [0, 0]) is not None else None
-            reasoning = json_str.get('reasoning', None) if json_str.get('reasoning', None) is not None else None
-            object_name = json_str.get('object_name', None) if json_str.get('object_name', None) is not None else None
-            action_queue = json_str.get('action_queue', None) if json_str.get('action_queue', None) is not None else None
-            return cls(destination=destination, object_name=object_name, action_queue=action_queue, reasoning=reasoning)
+            destination = json_str.get('destination', [0, 0])
+            if isinstance(destination, dict):
+                destination = Vector(destination['x'], destination['y'])
+            elif destination is not None:
+                destination = Vector(destination)
+            return cls.model_validate({
+                'destination': destination,
+                'object_name': json_str.get('object_name'),
+                'action_queue': json_str.get('action_queue'),
+                'reasoning': json_str.get('reasoning'),
+            })
         except Exception as e:
             logger.warning(f'Parse action space from json failed: {e}, using default action: DO_NOTHING')
             return cls()
@@ -170,7 +184,12 @@ class HighLevelActionSpace(BaseModel):
             'schema': {
                 'type': 'object',
                 'properties': {
-                    'destination': {'type': 'string', 'description': 'The destination of the navigate action. You should specify the destination of the navigate action.'},
+                    'destination': {
+                        'type': 'object',
+                        'properties': {'x': {'type': 'number'}, 'y': {'type': 'number'}},
+                        'required': ['x', 'y'],
+                        'description': 'The destination of the navigate action. You should specify the destination of the navigate action.',
+                    },
                     'object_name': {'type': 'string', 'description': 'The name of the object to interact with.'},
                     'action_queue': {'type': 'array', 'items': {'type': 'integer'}, 'description': 'A list of actions (index of the action) to be performed.'},
                     'reasoning': {'type': 'string', 'description': 'The reasoning of your choice.'},
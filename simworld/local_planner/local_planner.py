@@ -1,12 +1,9 @@
 """Local Planner module: translates high-level plans into simulator actions."""
 
 import math
-import time
 from threading import Event
 from typing import Optional
 
-import numpy as np
-
 from simworld.llm.a2a_llm import A2ALLM
 from simworld.local_planner.action_space import (HighLevelAction,
                                                  HighLevelActionSpace,
@@ -22,6 +19,24 @@ from simworld.utils.logger import Logger
 from simworld.utils.vector import Vector
 
 
+def _angle_to_waypoint(position: Vector, direction: Vector, waypoint: Vector) -> tuple[float, float]:
+    """Compute the unsigned angle between a heading and the direction to a waypoint.
+
+    Args:
+        position: Current position.
+        direction: Current heading.
+        waypoint: Target waypoint.
+
+    Returns:
+        Angle in degrees in [0, 180], and the cross product whose sign gives the turn side.
+    """
+    wx = waypoint.x - position.x
+    wy = waypoint.y - position.y
+    cross = direction.x * wy - direction.y * wx
+    dot = direction.x * wx + direction.y * wy
+    return abs(math.degrees(math.atan2(cross, dot))), cross
+
+
 class LocalPlanner:
     """Converts a high-level plan into low-level navigation actions."""
 
@@ -45,7 +60,8 @@ class LocalPlanner:
             dt: Simulation time step.
             observation_viewmode: Rendering mode for observations.
             rule_based: Whether to use rule-based navigation.
-            exit_event: Event to signal when the agent should stop.
+            exit_event: Event to signal when the agent should stop. Waits between
+                steps return as soon as it is set.
         """
         self.model = model
         self.agent = agent
@@ -56,9 +72,13 @@ class LocalPlanner:
         self.map: Map = self.agent.map
         self.rule_based = rule_based
         self.dt = dt
-        self.exit_event = exit_event
+        self.exit_event = exit_event if exit_event is not None else Event()
         self.logger = Logger.get_logger('LocalPlanner')
 
+        # Read once, these are checked on every navigation tick
+        self.waypoint_threshold_sq = self.agent.config['user.waypoint_distance_threshold'] ** 2
+        self.pedestrian_green_min = min(15, self.agent.config['traffic.traffic_signal.pedestrian_green_light_duration'])
+
         self.action_history = []
         self.last_image = None
 
@@ -76,14 +96,14 @@ class LocalPlanner:
             user_prompt=user_prompt,
             response_format=HighLevelActionSpace,
         )
-        self.logger.info(f'Agent {self.agent.id} Response: {response}, call time: {call_time}')
+        self.logger.info('Agent %s Response: %s, call time: %s', self.agent.id, response, call_time)
 
         if response is None:
             self.logger.error('Parse failed, response is None')
             return None
 
         actions = HighLevelActionSpace.from_json(response)
-        self.logger.info(f'Agent {self.agent.id} Actions: {actions}')
+        self.logger.info('Agent %s Actions: %s', self.agent.id, actions)
 
         return actions
 
@@ -107,13 +127,13 @@ class LocalPlanner:
 
     def navigate_to(self, destination: Vector) -> None:
         """Navigate from current position to a given destination."""
-        self.logger.info(f'Agent {self.agent.id} Target destination: {destination}')
+        self.logger.info('Agent %s Target destination: %s', self.agent.id, destination)
 
         if self.rule_based:
             # Get the shortest path from current position to the target destination
             path = self.map.get_shortest_path(self.map.get_closest_node(self.agent.position), self.map.get_closest_node(destination))
             path = [n.position for n in path]
-            self.logger.info(f'Agent {self.agent.id} Shortest Path: {path}')
+            self.logger.info('Agent %s Shortest Path: %s', self.agent.id, path)
             for point in path:
                 self.navigate_rule_based(point)
         else:
@@ -121,43 +141,50 @@ class LocalPlanner:
 
     def navigate_rule_based(self, point: Vector) -> None:
         """Navigate using traffic rules and conditions."""
-        self.logger.info(f'Agent {self.agent.id} is navigating to {point}, current position: {self.agent.position}, rule based mode')
+        self.logger.info('Agent %s is navigating to %s, current position: %s, rule based mode', self.agent.id, point, self.agent.position)
         if self.map.traffic_signals:
             current_node = self.map.get_closest_node(self.agent.position)
             if current_node.type == 'intersection':
                 traffic_light = None
-                min_distance = self.agent.config['traffic.sidewalk_offset'] * 2
+                min_distance_sq = (self.agent.config['traffic.sidewalk_offset'] * 2) ** 2
                 for signal in self.map.traffic_signals:
-                    distance = self.agent.position.distance(signal.position)
-                    if distance < min_distance:
-                        min_distance = distance
+                    distance_sq = self.agent.position.distance_sq(signal.position)
+                    if distance_sq < min_distance_sq:
+                        min_distance_sq = distance_sq
                         traffic_light = signal
 
                 if traffic_light is not None:
-                    while self.exit_event is None or not self.exit_event.is_set():
-                        state = traffic_light.get_state()
-                        left_time = traffic_light.get_left_time()
-                        if state[1] == TrafficSignalState.PEDESTRIAN_GREEN and left_time > min(15, self.agent.config['traffic.traffic_signal.pedestrian_green_light_duration']):
+                    while not self.exit_event.is_set():
+                        state, left_time = traffic_light.get_state_and_left_time()
+                        if state[1] == TrafficSignalState.PEDESTRIAN_GREEN and left_time > self.pedestrian_green_min:
                             break
-                        time.sleep(self.dt)
+                        self.exit_event.wait(self.dt)
 
-        time.sleep(2)
+        self.exit_event.wait(2)
         self.communicator.humanoid_move_forward(self.agent.id)
-        while not self._walk_arrive_at_waypoint(point) and (self.exit_event is None or not self.exit_event.is_set()):
-            while not self._align_direction(point) and (self.exit_event is None or not self.exit_event.is_set()):
-                self.communicator.humanoid_stop(self.agent.id)
+        while not self._walk_arrive_at_waypoint(point) and not self.exit_event.is_set():
+            # Moving and stopping are persistent states, so only send them when the state changes
+            stopped = False
+            while not self.exit_event.is_set():
+                # One angle computation serves both the alignment check and the rotation
                 angle, turn = self._get_angle_and_direction(point)
+                if angle < 5:
+                    break
+                if not stopped:
+                    self.communicator.humanoid_stop(self.agent.id)
+                    stopped = True
                 self.communicator.humanoid_rotate(self.agent.id, angle, turn)
-                time.sleep(self.dt)
-            self.communicator.humanoid_move_forward(self.agent.id)
-            time.sleep(self.dt)
+                self.exit_event.wait(self.dt)
+            if stopped:
+                self.communicator.humanoid_move_forward(self.agent.id)
+            self.exit_event.wait(self.dt)
         self.communicator.humanoid_stop(self.agent.id)
 
     def navigate_vision_based(self, point: Vector) -> None:
         """Placeholder for vision-based navigation logic."""
-        self.logger.info(f'Agent {self.agent.id} is navigating to {point}, current position: {self.agent.position}, vision based mode')
-        while not self._walk_arrive_at_waypoint(point) and (self.exit_event is None or not self.exit_event.is_set()):
-            time.sleep(self.dt)
+        self.logger.info('Agent %s is navigating to %s, current position: %s, vision based mode', self.agent.id, point, self.agent.position)
+        while not self._walk_arrive_at_waypoint(point) and not self.exit_event.is_set():
+            self.exit_event.wait(self.dt)
 
             images = []
             image = self.communicator.get_camera_observation(self.camera_id, self.observation_viewmode, mode='direct')
@@ -211,7 +238,7 @@ class LocalPlanner:
                 continue
 
             vlm_action = LowLevelActionSpace.from_json(response)
-            self.logger.info(f'Agent {self.agent.id} is taking action {vlm_action}')
+            self.logger.info('Agent %s is taking action %s', self.agent.id, vlm_action)
 
             if vlm_action.choice == LowLevelAction.STEP_FORWARD:
                 self.communicator.humanoid_step_forward(self.agent.id, vlm_action.duration, vlm_action.direction)
@@ -240,9 +267,8 @@ class LocalPlanner:
 
     def _walk_arrive_at_waypoint(self, waypoint: Vector) -> bool:
         """Return True if humanoid is within threshold of waypoint."""
-        threshold = self.agent.config['user.waypoint_distance_threshold']
-        if self.agent.position.distance(waypoint) < threshold:
-            self.logger.info(f'Agent {self.agent.id} Arrived at {waypoint}')
+        if self.agent.position.distance_sq(waypoint) < self.waypoint_threshold_sq:
+            self.logger.info('Agent %s Arrived at %s', self.agent.id, waypoint)
             return True
         return False
 
@@ -251,25 +277,12 @@ class LocalPlanner:
         waypoint: Vector,
     ) -> tuple[float, Optional[str]]:
         """Compute angle and turn direction to face the waypoint."""
-        to_wp = waypoint - self.agent.position
-        angle = math.degrees(
-            math.acos(np.clip(self.agent.direction.dot(to_wp.normalize()), -1, 1))
-        )
-        cross = self.agent.direction.cross(to_wp)
-        turn_direction = 'left' if cross < 0 else 'right'
+        angle, cross = _angle_to_waypoint(self.agent.position, self.agent.direction, waypoint)
         if angle < 2:
             return 0.0, None
-        return angle, turn_direction
-
-    def _align_direction(self, waypoint: Vector) -> bool:
-        """Return True if facing the waypoint within a small angle."""
-        to_wp = waypoint - self.agent.position
-        angle = math.degrees(
-            math.acos(np.clip(self.agent.direction.dot(to_wp.normalize()), -1, 1))
-        )
-        return angle < 5
+        return angle, 'left' if cross < 0 else 'right'
 
     def pick_up(self, object_name: str) -> None:
         """Pick up an object."""
         ret = self.communicator.humanoid_pick_up_object(self.agent.id, object_name)
-        self.logger.info(f'Agent {self.agent.id} picked up {object_name}: {ret}')
\ No newline at end of file
+        self.logger.info('Agent %s picked up %s: %s', self.agent.id, object_name, ret)
\ No newline at end of file
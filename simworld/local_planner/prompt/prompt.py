@@ -16,8 +16,8 @@ You should parse the plan into a list of actions. Output your decision in JSON f
 
 Example outputs:
 
-{{"action_queue": [0, 1], "destination": [200, 0], "reasoning": "I need to go to the destination."}}
-{{"action_queue": [0, 1, 2], "destination": [100, 100], "object_name": "bottle", "reasoning": "I need to go to the destination and pick up the bottle."}}
+{{"action_queue": [0, 1], "destination": {{"x": 200, "y": 0}}, "reasoning": "I need to go to the destination."}}
+{{"action_queue": [0, 1, 2], "destination": {{"x": 100, "y": 100}}, "object_name": "bottle", "reasoning": "I need to go to the destination and pick up the bottle."}}
 """
 
 
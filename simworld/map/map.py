@@ -1,23 +1,34 @@
 """Map module: defines Road, Node, Edge, and Map graph structures for navigation."""
 
-import heapq
+import os
 import random
 import sys
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
+from threading import Lock
 from typing import List
 
+import numpy as np
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QColor, QPainter, QPen
 from PyQt5.QtWidgets import QApplication, QWidget
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import dijkstra
+from scipy.spatial import cKDTree
 
 from simworld.config import Config
 from simworld.utils.load_json import load_json
 from simworld.utils.vector import Vector
 
+# Number of start nodes whose shortest path trees are kept by a Map
+_PATH_CACHE_SIZE = 1024
+
 
 class Road:
     """Represents a road segment between two points."""
 
+    __slots__ = ('start', 'end', '_direction', '_length', '_center')
+
     def __init__(self, start: Vector, end: Vector):
         """Initialize a Road.
 
@@ -27,9 +38,48 @@ class Road:
         """
         self.start = start
         self.end = end
-        self.direction = (end - start).normalize()
-        self.length = start.distance(end)
-        self.center = (start + end) / 2
+        self._direction = None
+        self._length = None
+        self._center = None
+
+    @property
+    def direction(self) -> Vector:
+        """Unit vector from start to end, computed on first access."""
+        if self._direction is None:
+            self._direction = (self.end - self.start).normalize()
+        return self._direction
+
+    @property
+    def length(self) -> float:
+        """Length of the road, computed on first access."""
+        if self._length is None:
+            self._length = self.start.distance(self.end)
+        return self._length
+
+    @property
+    def center(self) -> Vector:
+        """Midpoint of the road, computed on first access."""
+        if self._center is None:
+            self._center = (self.start + self.end) / 2
+        return self._center
+
+
+@lru_cache(maxsize=4)
+def _load_roads(file_path: str, mtime: float = None) -> tuple:
+    """Load and cache the roads of a roads file.
+
+    Args:
+        file_path: Path to the roads file.
+        mtime: Modification time of the file, so edited files are read again.
+
+    Returns:
+        Tuple of roads in the file.
+    """
+    roads_data = load_json(file_path)
+    return tuple(
+        Road(Vector(road['start']['x'] * 100, road['start']['y'] * 100), Vector(road['end']['x'] * 100, road['end']['y'] * 100))
+        for road in roads_data.get('roads', [])
+    )
 
 
 class Node:
@@ -124,9 +174,23 @@ class Map:
         self.config = config
         self.traffic_signals = traffic_signals
 
+        # Shortest path tables, built lazily and reset whenever the graph changes
+        self._node_list = None
+        self._node_index = None
+        self._node_positions = None
+        self._node_tree = None
+        self._graph = None
+        self._predecessor_rows = OrderedDict()
+        self._path_lock = Lock()
+
+        # The summary embeds every node and edge and goes into each planner prompt, so it is built once per graph change
+        self._summary = None
+
     def __str__(self) -> str:
         """Return a summary of nodes and edges."""
-        return f'Nodes: {self.nodes}\nEdges: {self.edges}\n'
+        if self._summary is None:
+            self._summary = f'Nodes: {self.nodes}\nEdges: {self.edges}\n'
+        return self._summary
 
     def __repr__(self) -> str:
         """Alias for __str__."""
@@ -145,16 +209,9 @@ class Map:
         """
         file_path = roads_file if roads_file else self.config['map.input_roads']
         side_offset = sidewalk_offset if sidewalk_offset else self.config['traffic.sidewalk_offset']
-        roads_data = load_json(file_path)
-
-        road_items = roads_data.get('roads', [])
-        road_objects = []
-        for road in road_items:
-            start = Vector(road['start']['x'] * 100, road['start']['y'] * 100)
-            end = Vector(road['end']['x'] * 100, road['end']['y'] * 100)
-            road_objects.append(Road(start, end))
+        mtime = os.path.getmtime(file_path) if os.path.isfile(file_path) else None
 
-        for road in road_objects:
+        for road in _load_roads(file_path, mtime):
             normal = Vector(road.direction.y, -road.direction.x)
             offset = side_offset
             p1 = road.start - normal * offset + road.direction * offset
@@ -176,40 +233,48 @@ class Map:
         if fine_grained:
             self._interpolate_nodes(num_waypoints_normal, waypoints_distance, waypoints_normal_distance, side_offset)
 
+        self._build_graph()
+
     def get_shortest_path(self, start: Node, end: Node):
-        """Get the shortest path between two nodes using A* algorithm. Include the start node and end node in the path.
+        """Get the shortest path between two nodes. Include the start node and end node in the path.
+
+        The shortest path tree of each start node is computed once and kept in an LRU cache, so repeated
+        queries from the same node only walk the path itself.
 
         Args:
             start: Start node.
             end: End node.
 
         Returns:
-            List of nodes in the shortest path.
+            List of nodes in the shortest path. If no path is found, return None.
         """
-        open_heap = []
-        heapq.heappush(open_heap, (start.position.distance(end.position), 0, start))
-        came_from = {}
-        g_score = {start: 0}
-        closed_set = set()
-
-        while open_heap:
-            _, current_g, current = heapq.heappop(open_heap)
-            if current == end:
-                return self._reconstruct_path(start, end, came_from)
-            if current in closed_set:
-                continue
-            closed_set.add(current)
-
-            for neighbor in self.adjacency_list.get(current, []):
-                tentative_g = g_score[current] + current.position.distance(neighbor.position)
-                if neighbor in closed_set and tentative_g >= g_score.get(neighbor, float('inf')):
-                    continue
-                if tentative_g < g_score.get(neighbor, float('inf')):
-                    came_from[neighbor] = current
-                    g_score[neighbor] = tentative_g
-                    f_score = tentative_g + neighbor.position.distance(end.position)
-                    heapq.heappush(open_heap, (f_score, tentative_g, neighbor))
-        return None
+        with self._path_lock:
+            if self._graph is None:
+                self._build_graph()
+            start_idx = self._node_index.get(start)
+            current = self._node_index.get(end)
+            if start_idx is None or current is None:
+                return None
+            node_list = self._node_list
+
+            # Edge weights are straight-line distances, so a direct edge is always a shortest path
+            if current == start_idx:
+                return [node_list[current]]
+            if end in self.adjacency_list[start]:
+                return [node_list[start_idx], node_list[current]]
+
+            predecessors = self._get_predecessors(start_idx)
+
+        path = [node_list[current]]
+        while current != start_idx:
+            current = predecessors[current]
+            if current < 0:
+                # If no path is found, return None
+                return None
+            path.append(node_list[current])
+        # Reverse the path in place, from start to end
+        path.reverse()
+        return path
 
     def add_node(self, node: Node) -> None:
         """Add a node to the map.
@@ -219,6 +284,9 @@ class Map:
         """
         self.nodes.add(node)
         self.adjacency_list[node] = []
+        self._node_positions = None
+        self._graph = None
+        self._summary = None
 
     def add_edge(self, edge: Edge) -> None:
         """Add an edge and update adjacency.
@@ -229,6 +297,8 @@ class Map:
         self.edges.add(edge)
         self.adjacency_list[edge.node1].append(edge.node2)
         self.adjacency_list[edge.node2].append(edge.node1)
+        self._graph = None
+        self._summary = None
 
     def get_adjacency_list(self) -> dict:
         """Get the adjacency list mapping each node to its neighbors."""
@@ -254,14 +324,13 @@ class Map:
         Returns:
             Nearest node.
         """
-        min_distance = float('inf')
-        closest_node = None
-        for node in self.nodes:
-            distance = position.distance(node.position)
-            if distance < min_distance:
-                min_distance = distance
-                closest_node = node
-        return closest_node
+        if self._node_positions is None:
+            self._build_node_index()
+        if self._node_tree is None:
+            return None
+
+        _, index = self._node_tree.query((position.x, position.y))
+        return self._node_list[index]
 
     def get_random_node(self, type: str = None, exclude: List[Node] = None) -> Node:
         """Get a random node from the map.
@@ -303,28 +372,48 @@ class Map:
         """
         return edge in self.edges
 
-    def _reconstruct_path(self, start, end, came_from):
-        """Reconstruct the path from the end node to the start node using the came_from dictionary.
+    def _build_node_index(self) -> None:
+        """Assign each node an index and gather the node positions into one array and a KD-tree."""
+        self._node_list = list(self.nodes)
+        self._node_index = {node: i for i, node in enumerate(self._node_list)}
+        self._node_positions = np.array([(node.position.x, node.position.y) for node in self._node_list], dtype=np.float64).reshape(-1, 2)
+        self._node_tree = cKDTree(self._node_positions) if self._node_list else None
+
+    def _build_graph(self) -> None:
+        """Index the nodes, build the weighted sparse graph and drop the cached shortest path trees."""
+        self._build_node_index()
+        self._predecessor_rows.clear()
+
+        # Follow the adjacency list, dropping repeated neighbors so their weights are not summed
+        index = self._node_index
+        links = {(index[node], index[neighbor]) for node, neighbors in self.adjacency_list.items() for neighbor in neighbors}
+
+        # Edge weights are the node distances, computed for all links in one pass
+        num_nodes = len(self._node_list)
+        rows, cols = np.array(list(links), dtype=np.int32).reshape(-1, 2).T
+        offsets = self._node_positions[rows] - self._node_positions[cols]
+        weights = np.hypot(offsets[:, 0], offsets[:, 1])
+        self._graph = csr_matrix((weights, (rows, cols)), shape=(num_nodes, num_nodes))
+
+    def _get_predecessors(self, start_idx: int) -> np.ndarray:
+        """Get the shortest path tree rooted at a node, computing and caching it on first use.
 
         Args:
-            start: Start node.
-            end: End node.
-            came_from: Dictionary of nodes and their predecessors.
+            start_idx: Index of the start node.
 
         Returns:
-            List of nodes in the shortest path. If no path is found, return None.
+            Predecessor of every node on its shortest path from the start node, -9999 if unreachable.
         """
-        current = end
-        path = [current]
-        while current != start:
-            # Use the came_from dictionary instead of g_score
-            if current not in came_from:
-                # If no path is found, return None
-                return None
-            current = came_from[current]
-            path.append(current)
-        # Reverse the path, from start to end
-        return path[::-1]
+        predecessors = self._predecessor_rows.get(start_idx)
+        if predecessors is not None:
+            self._predecessor_rows.move_to_end(start_idx)
+            return predecessors
+
+        _, predecessors = dijkstra(self._graph, directed=True, indices=start_idx, return_predecessors=True)
+        self._predecessor_rows[start_idx] = predecessors
+        if len(self._predecessor_rows) > _PATH_CACHE_SIZE:
+            self._predecessor_rows.popitem(last=False)
+        return predecessors
 
     def _connect_adjacent_roads(self, threshold: float) -> None:
         """Link nodes from nearby roads within a threshold."""
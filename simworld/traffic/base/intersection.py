@@ -281,9 +281,8 @@ class Intersection:
         """
         for traffic_light in self.traffic_lights:
             if traffic_light.crosswalk_id == crosswalk.id:
-                state = traffic_light.get_state()[1]
-                left_time = traffic_light.get_left_time()
-                return state, left_time
+                state, left_time = traffic_light.get_state_and_left_time()
+                return state[1], left_time
 
         # If no traffic light is found, return the pedestrian green light
         return TrafficSignalState.PEDESTRIAN_GREEN, 20
@@ -104,3 +104,11 @@ class TrafficSignal:
             The time in seconds until the signal changes.
         """
         return self.left_time
+
+    def get_state_and_left_time(self):
+        """Get the current state and the remaining time of the traffic signal in one call.
+
+        Returns:
+            A tuple of ((vehicle_state, pedestrian_state), left_time).
+        """
+        return self.state, self.left_time
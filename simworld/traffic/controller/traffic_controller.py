@@ -4,8 +4,6 @@ This module provides the main controller for the traffic simulation, handling in
 spawning, and coordination of all traffic elements including vehicles, pedestrians, and traffic signals.
 """
 import random
-import time
-import traceback
 from collections import defaultdict
 from threading import Event
 from typing import Callable
@@ -29,6 +27,14 @@ from simworld.utils.load_json import load_json
 from simworld.utils.logger import Logger
 from simworld.utils.vector import Vector
 
+# Signal states keyed by the (is_vehicle_green, is_pedestrian_walk) flags reported by the simulator
+_SIGNAL_STATES = {
+    (True, True): (TrafficSignalState.VEHICLE_GREEN, TrafficSignalState.PEDESTRIAN_RED),
+    (True, False): (TrafficSignalState.VEHICLE_GREEN, TrafficSignalState.PEDESTRIAN_RED),
+    (False, True): (TrafficSignalState.VEHICLE_RED, TrafficSignalState.PEDESTRIAN_GREEN),
+    (False, False): (TrafficSignalState.VEHICLE_RED, TrafficSignalState.PEDESTRIAN_RED),
+}
+
 
 class TrafficController:
     """Main controller class for the traffic simulation system.
@@ -161,12 +167,8 @@ class TrafficController:
             self.spawn_vehicles()
             self.spawn_pedestrians()
             self.spawn_traffic_signals()
-        except Exception as e:
-            self.logger.error(f'Error occurred in {__file__}:{e.__traceback__.tb_lineno}')
-            self.logger.error(f'Error type: {type(e).__name__}')
-            self.logger.error(f'Error message: {str(e)}')
-            self.logger.error('Error traceback:')
-            traceback.print_exc()
+        except Exception:
+            self.logger.exception('Error occurred while spawning objects')
 
     def spawn_vehicles(self):
         """Spawn vehicles in the simulation environment."""
@@ -240,59 +242,52 @@ class TrafficController:
             self.pedestrian_manager.set_pedestrians_max_speed(self.communicator)
             self.intersection_manager.set_traffic_signal_duration(self.communicator)
 
-            while not (exit_event and exit_event.is_set()):
+            if exit_event is None:
+                exit_event = Event()
+
+            while not exit_event.is_set():
                 physical_update_function()
                 self.vehicle_manager.update_vehicles(self.communicator, self.intersection_manager, self.pedestrians)
                 self.pedestrian_manager.update_pedestrians(self.communicator, self.intersection_manager)
                 self.intersection_manager.update_intersections(self.communicator)
 
                 if signal_event is not None:
-                    while not signal_event.is_set():
-                        time.sleep(self.dt)
-                        signal_event.clear()  # Reset the event for next iteration
+                    # Block until the next tick is signalled, waking up every dt to honour exit_event
+                    while not signal_event.wait(self.dt):
+                        if exit_event.is_set():
+                            break
+                    signal_event.clear()  # Reset the event for next iteration
                 else:
-                    time.sleep(self.dt)
+                    # Sleep for one tick, but return immediately once exit_event is set
+                    exit_event.wait(self.dt)
 
             self.stop_simulation()
             self.logger.info('Simulation ended')
         except KeyboardInterrupt:
             self.logger.info('Simulation interrupted')
             self.stop_simulation()
-        except Exception as e:
-            self.logger.error(f'Error occurred in {__file__}:{e.__traceback__.tb_lineno}')
-            self.logger.error(f'Error type: {type(e).__name__}')
-            self.logger.error(f'Error message: {str(e)}')
-            self.logger.error('Error traceback:')
-            traceback.print_exc()
+        except Exception:
+            self.logger.exception('Error occurred in simulation')
             self.stop_simulation()
 
     def update_states(self):
         """Update the states of all traffic components from the simulation."""
-        vehicle_ids = [vehicle.id for vehicle in self.vehicles]
-        pedestrian_ids = [pedestrian.id for pedestrian in self.pedestrians]
-        traffic_signal_ids = [signal.id for signal in self.traffic_signals]
-        result = self.communicator.get_position_and_direction(vehicle_ids, pedestrian_ids, traffic_signal_ids)
+        vehicles = self.vehicles
+        pedestrians = self.pedestrians
+        traffic_signals = {signal.id: signal for signal in self.traffic_signals}
+        result = self.communicator.get_position_and_direction([vehicle.id for vehicle in vehicles],
+                                                              [pedestrian.id for pedestrian in pedestrians],
+                                                              list(traffic_signals))
         for (type, object_id), values in result.items():
             if type == 'vehicle':
-                position, direction = values
-                self.vehicles[object_id].position = position
-                self.vehicles[object_id].direction = direction
+                vehicles[object_id].position, vehicles[object_id].direction = values
             elif type == 'pedestrian':
-                position, direction = values
-                self.pedestrians[object_id].position = position
-                self.pedestrians[object_id].direction = direction
+                pedestrians[object_id].position, pedestrians[object_id].direction = values
             elif type == 'traffic_signal':
                 is_vehicle_green, is_pedestrian_walk, left_time = values
-                for signal in self.traffic_signals:
-                    if signal.id == object_id:
-                        if is_vehicle_green:
-                            signal.set_state((TrafficSignalState.VEHICLE_GREEN, TrafficSignalState.PEDESTRIAN_RED))
-                        elif is_pedestrian_walk:
-                            signal.set_state((TrafficSignalState.VEHICLE_RED, TrafficSignalState.PEDESTRIAN_GREEN))
-                        else:
-                            signal.set_state((TrafficSignalState.VEHICLE_RED, TrafficSignalState.PEDESTRIAN_RED))
-                        signal.set_left_time(left_time)
-                        break
+                signal = traffic_signals[object_id]
+                signal.set_state(_SIGNAL_STATES[(is_vehicle_green, is_pedestrian_walk)])
+                signal.set_left_time(left_time)
 
     @property
     def vehicles(self):
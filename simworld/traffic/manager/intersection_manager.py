@@ -109,13 +109,13 @@ class IntersectionManager:
             The closest intersection containing the sidewalk, or None if not found.
         """
         closest_intersection = None
-        min_distance = float('inf')
+        min_distance_sq = float('inf')
 
         for intersection in self.intersections:
             if sidewalk in intersection.sidewalks.keys():
-                distance = current_waypoint.distance(intersection.center)
-                if distance < min_distance:
-                    min_distance = distance
+                distance_sq = current_waypoint.distance_sq(intersection.center)
+                if distance_sq < min_distance_sq:
+                    min_distance_sq = distance_sq
                     closest_intersection = intersection
 
         return closest_intersection
@@ -199,10 +199,10 @@ class IntersectionManager:
 
         # If there is a crosswalk, add the two points of the next_sidewalk as waypoints
         if crosswalk is not None:
-            next_waypoints = [next_sidewalk.start, next_sidewalk.end] if current_waypoint.distance(next_sidewalk.start) < current_waypoint.distance(next_sidewalk.end) else [next_sidewalk.end, next_sidewalk.start]
+            next_waypoints = [next_sidewalk.start, next_sidewalk.end] if current_waypoint.distance_sq(next_sidewalk.start) < current_waypoint.distance_sq(next_sidewalk.end) else [next_sidewalk.end, next_sidewalk.start]
         else:
             # If there is no crosswalk, add the farther point of the next_sidewalk as waypoints
-            next_waypoints = [next_sidewalk.start] if current_waypoint.distance(next_sidewalk.start) > current_waypoint.distance(next_sidewalk.end) else [next_sidewalk.end]
+            next_waypoints = [next_sidewalk.start] if current_waypoint.distance_sq(next_sidewalk.start) > current_waypoint.distance_sq(next_sidewalk.end) else [next_sidewalk.end]
 
         return next_sidewalk, crosswalk, next_waypoints, current_intersection
 
@@ -220,7 +220,7 @@ class IntersectionManager:
 
             # If all lights are red, turn the first light green
             if intersection.all_traffic_lights_red() and intersection.cycle_count == 0:
-                self.logger.debug(f'Intersection {intersection.id} will turn green on lane {intersection.traffic_lights[0].lane_id}')
+                self.logger.debug('Intersection %s will turn green on lane %s', intersection.id, intersection.traffic_lights[0].lane_id)
                 communicator.traffic_signal_switch_to(intersection.traffic_lights[0].id, 'green')
                 self.python_states[intersection.traffic_lights[0].id] = (TrafficSignalState.VEHICLE_GREEN, TrafficSignalState.PEDESTRIAN_RED)
                 intersection.increment_cycle_count()
@@ -229,7 +229,7 @@ class IntersectionManager:
             # Check if we need to switch to pedestrian crossing
             if intersection.has_completed_cycle():
                 if all(light.get_state()[0] == TrafficSignalState.VEHICLE_RED for light in intersection.traffic_lights):
-                    self.logger.debug(f'Intersection {intersection.id} will turn green on all pedestrian lanes')
+                    self.logger.debug('Intersection %s will turn green on all pedestrian lanes', intersection.id)
                     for light in intersection.pedestrian_lights:
                         communicator.traffic_signal_switch_to(light.id, 'pedestrian walk')
                     for light in intersection.traffic_lights:
@@ -243,13 +243,13 @@ class IntersectionManager:
                 if light.get_state()[0] == TrafficSignalState.VEHICLE_RED:  # UE state is red
                     # Check if UE state is different from Python state (indicating need to change)
                     if self.python_states.get(light.id, (None, None))[0] == TrafficSignalState.VEHICLE_GREEN:
-                        self.logger.debug(f'Intersection {intersection.id} will turn red on lane {light.lane_id}')
+                        self.logger.debug('Intersection %s will turn red on lane %s', intersection.id, light.lane_id)
                         # Set current light to red
                         self.python_states[light.id] = (TrafficSignalState.VEHICLE_RED, TrafficSignalState.PEDESTRIAN_RED)
 
                         # Set next light to green
                         next_light = intersection.traffic_lights[(i + 1) % len(intersection.traffic_lights)]
-                        self.logger.debug(f'Intersection {intersection.id} will turn green on lane {next_light.lane_id}')
+                        self.logger.debug('Intersection %s will turn green on lane %s', intersection.id, next_light.lane_id)
                         self.python_states[next_light.id] = (TrafficSignalState.VEHICLE_GREEN, TrafficSignalState.PEDESTRIAN_RED)
                         communicator.traffic_signal_switch_to(next_light.id, 'green')
 
@@ -5,9 +5,13 @@ It manages pedestrian lifecycle, movement logic, and interaction with traffic si
 """
 import random
 
+import numpy as np
+
 from simworld.agent.pedestrian import Pedestrian, PedestrianState
 from simworld.traffic.base.traffic_signal import TrafficSignalState
 from simworld.utils.logger import Logger
+from simworld.utils.traffic_utils import sample_points_on_segments
+from simworld.utils.vector import Vector
 
 
 class PedestrianManager:
@@ -40,34 +44,42 @@ class PedestrianManager:
         """Initialize the pedestrians and place them on the sidewalks.
 
         Pedestrians are randomly placed on sidewalks, ensuring they maintain safe distances
-        from other pedestrians and intersections.
+        from other pedestrians and intersections. Candidate positions are sampled in batches
+        over all sidewalks at once.
         """
+        sidewalks = [sidewalk for road in self.roads for sidewalk in road.sidewalks.values()]
+        starts = np.array([(sidewalk.start.x, sidewalk.start.y) for sidewalk in sidewalks])
+        ends = np.array([(sidewalk.end.x, sidewalk.end.y) for sidewalk in sidewalks])
+        lengths = np.linalg.norm(ends - starts, axis=1)
+        rng = np.random.default_rng(random.getrandbits(64))
+
         while len(self.pedestrians) < self.num_pedestrians:
-            target_road = random.choice(self.roads)
-            target_sidewalk = random.choice(list(target_road.sidewalks.values()))
-            target_position = random.uniform(target_sidewalk.start, target_sidewalk.end)
-
-            # check if the pedestrian is too close to the intersection
-            if target_position.distance(target_sidewalk.end) < self.config['traffic.crosswalk_offset']:
-                continue
-
-            possible_pedestrians = target_sidewalk.pedestrians
-            for pedestrian in possible_pedestrians:
-                if pedestrian.position.distance(target_position) < 0.5 * self.config['traffic.distance_between_objects']:
-                    break
-            else:
-                target_direction = target_sidewalk.direction * random.choice([1, -1])
-                new_pedestrian = Pedestrian(position=target_position, direction=target_direction, current_sidewalk=target_sidewalk,
-                                            speed=random.choice([self.config['traffic.pedestrian.min_speed'], self.config['traffic.pedestrian.max_speed']]))
-
-                if target_direction.dot(target_sidewalk.direction) < 0:  # if the target direction is opposite to the sidewalk direction, add the start point as a waypoint
-                    new_pedestrian.add_waypoint([target_sidewalk.start])
-                else:   # if the target direction is the same as the sidewalk direction, add the end point as a waypoint
-                    new_pedestrian.add_waypoint([target_sidewalk.end])
-                target_sidewalk.add_pedestrian(new_pedestrian)
-                self.pedestrians.append(new_pedestrian)
-
-                self.logger.info(f'Spawned Pedestrian: {new_pedestrian.id} on Sidewalk {target_sidewalk.id} at {target_position}')
+            indices, fractions, points = sample_points_on_segments(starts, ends, self.num_pedestrians - len(self.pedestrians), rng)
+
+            # drop candidates that are too close to the intersection
+            keep = (1 - fractions) * lengths[indices] >= self.config['traffic.crosswalk_offset']
+
+            for index, (x, y) in zip(indices[keep], points[keep]):
+                target_sidewalk = sidewalks[index]
+                target_position = Vector(x, y)
+
+                possible_pedestrians = target_sidewalk.pedestrians
+                for pedestrian in possible_pedestrians:
+                    if pedestrian.position.distance_sq(target_position) < (0.5 * self.config['traffic.distance_between_objects']) ** 2:
+                        break
+                else:
+                    target_direction = target_sidewalk.direction * random.choice([1, -1])
+                    new_pedestrian = Pedestrian(position=target_position, direction=target_direction, current_sidewalk=target_sidewalk,
+                                                speed=random.choice([self.config['traffic.pedestrian.min_speed'], self.config['traffic.pedestrian.max_speed']]))
+
+                    if target_direction.dot(target_sidewalk.direction) < 0:  # if the target direction is opposite to the sidewalk direction, add the start point as a waypoint
+                        new_pedestrian.add_waypoint([target_sidewalk.start])
+                    else:   # if the target direction is the same as the sidewalk direction, add the end point as a waypoint
+                        new_pedestrian.add_waypoint([target_sidewalk.end])
+                    target_sidewalk.add_pedestrian(new_pedestrian)
+                    self.pedestrians.append(new_pedestrian)
+
+                    self.logger.info(f'Spawned Pedestrian: {new_pedestrian.id} on Sidewalk {target_sidewalk.id} at {target_position}')
 
     def spawn_pedestrians(self, communicator):
         """Spawn pedestrians in the simulation environment.
@@ -96,6 +108,8 @@ class PedestrianManager:
             communicator: Interface for sending updates to the simulation.
             intersection_controller: Controller for managing intersection logic.
         """
+        # Commands of all pedestrians are collected and sent in one request at the end of the update
+        actions = []
         for pedestrian in self.pedestrians:
             if pedestrian.state == PedestrianState.TURN_AROUND:
                 if pedestrian.complete_turn():
@@ -107,7 +121,7 @@ class PedestrianManager:
             if pedestrian.is_close_to_end(self.config['traffic.pedestrian.waypoint_distance_threshold']):
                 next_sidewalk, crosswalk, waypoints, current_intersection = intersection_controller.get_waypoints_for_pedestrian(pedestrian.current_sidewalk, pedestrian.waypoints[0])
                 if next_sidewalk is None or waypoints is None:
-                    self.logger.debug(f'Pedestrian {pedestrian.id} has no waypoints to move to')
+                    self.logger.debug('Pedestrian %s has no waypoints to move to', pedestrian.id)
                     continue
 
                 if crosswalk is not None:
@@ -115,39 +129,42 @@ class PedestrianManager:
                     if pedestrian_light_state == TrafficSignalState.PEDESTRIAN_GREEN and left_time > min(15, self.config['traffic.traffic_signal.pedestrian_green_light_duration']):
                         pedestrian.add_waypoint(waypoints)
                         pedestrian.change_to_next_sidewalk(next_sidewalk)
-                        self.logger.debug(f'Pedestrian {pedestrian.id} is moving to Sidewalk {next_sidewalk.id} with waypoints {waypoints}')
+                        self.logger.debug('Pedestrian %s is moving to Sidewalk %s with waypoints %s', pedestrian.id, next_sidewalk.id, waypoints)
                     else:
                         if not pedestrian.state == PedestrianState.STOP:
-                            self.logger.debug(f'Pedestrian {pedestrian.id} is waiting at crosswalk {crosswalk.id}')
+                            self.logger.debug('Pedestrian %s is waiting at crosswalk %s', pedestrian.id, crosswalk.id)
                             pedestrian.state = PedestrianState.STOP
-                            communicator.pedestrian_stop(pedestrian.id)
+                            actions.append((pedestrian.id, 'stop', ()))
                         continue
                 else:
                     pedestrian.add_waypoint(waypoints)
                     pedestrian.change_to_next_sidewalk(next_sidewalk)
-                    self.logger.debug(f'Pedestrian {pedestrian.id} is moving to Sidewalk {next_sidewalk.id} with waypoints {waypoints}')
+                    self.logger.debug('Pedestrian %s is moving to Sidewalk %s with waypoints %s', pedestrian.id, next_sidewalk.id, waypoints)
 
             # pop waypoint if the pedestrian has reached the waypoint
             if pedestrian.waypoints and len(pedestrian.waypoints) > 0:
                 to_waypoint = pedestrian.waypoints[0] - pedestrian.position
-                dot_product = pedestrian.direction.dot(to_waypoint.normalize())
+                # Only the sign of the dot product matters, so the offset is not normalized
+                dot_product = pedestrian.direction.dot(to_waypoint)
                 if dot_product < 0:
-                    self.logger.debug(f'Pedestrian {pedestrian.id} passed waypoint {pedestrian.waypoints[0]}')
+                    self.logger.debug('Pedestrian %s passed waypoint %s', pedestrian.id, pedestrian.waypoints[0])
                     pedestrian.pop_waypoint()
 
             # compute the control input for the pedestrian
             if pedestrian.waypoints:
                 if pedestrian.state == PedestrianState.STOP:
                     pedestrian.state = PedestrianState.MOVE_FORWARD
-                    communicator.pedestrian_move_forward(pedestrian.id)
+                    actions.append((pedestrian.id, 'move_forward', ()))
 
                 angle, turn_direction = pedestrian.compute_control(pedestrian.waypoints[0])
                 if angle != 0:
                     pedestrian.state = PedestrianState.TURN_AROUND
-                    communicator.pedestrian_rotate(pedestrian.id, angle, turn_direction)
+                    actions.append((pedestrian.id, 'rotate', (angle, turn_direction)))
+
+        communicator.pedestrian_actions_batch(actions)
 
     def stop_pedestrians(self, communicator):
         """Stop all pedestrians in the simulation."""
         for pedestrian in self.pedestrians:
             pedestrian.state = PedestrianState.STOP
-            communicator.pedestrian_stop(pedestrian.id)
+        communicator.pedestrian_actions_batch([(pedestrian.id, 'stop', ()) for pedestrian in self.pedestrians])
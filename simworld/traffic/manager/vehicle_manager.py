@@ -5,11 +5,16 @@ It manages vehicle lifecycle, movement logic, and interaction with traffic signa
 """
 import random
 
-from simworld.agent.vehicle import Vehicle, VehicleState
+import numpy as np
+
+from simworld.agent.vehicle import (Vehicle, VehicleState,
+                                    gather_object_states)
 from simworld.traffic.base.traffic_signal import TrafficSignalState
 from simworld.utils.load_json import load_json
 from simworld.utils.logger import Logger
-from simworld.utils.traffic_utils import cal_waypoints
+from simworld.utils.traffic_utils import (cal_waypoints,
+                                          sample_points_on_segments)
+from simworld.utils.vector import Vector
 
 
 class VehicleManager:
@@ -45,37 +50,46 @@ class VehicleManager:
         """Initialize the vehicles and place them on the roads.
 
         Vehicles are randomly placed on lanes, ensuring they maintain safe distances
-        from other vehicles and intersections.
+        from other vehicles and intersections. Candidate positions are sampled in batches
+        over all lanes at once.
         """
+        lanes = [lane for road in self.roads for lane in road.lanes.values()]
+        starts = np.array([(lane.start.x, lane.start.y) for lane in lanes])
+        ends = np.array([(lane.end.x, lane.end.y) for lane in lanes])
+        lengths = np.linalg.norm(ends - starts, axis=1)
+        vehicle_types = list(self.vehicle_types.values())
+        rng = np.random.default_rng(random.getrandbits(64))
+
         while len(self.vehicles) < self.num_vehicles:
-            target_road = random.choice(self.roads)
-            target_lane = random.choice(list(target_road.lanes.values()))
-            target_position = random.uniform(target_lane.start, target_lane.end)
+            indices, fractions, points = sample_points_on_segments(starts, ends, self.num_vehicles - len(self.vehicles), rng)
 
-            # check if the vehicle is too close to intersection
-            if target_position.distance(target_lane.end) < 3 * self.config['traffic.distance_between_objects']:
-                continue
+            # drop candidates that are too close to the intersection
+            keep = (1 - fractions) * lengths[indices] >= 3 * self.config['traffic.distance_between_objects']
 
-            possible_vehicles = target_lane.vehicles
-            for vehicle in possible_vehicles:
-                # check if the vehicle is too close to another vehicle
-                if vehicle.position.distance(target_position) < 2 * self.config['traffic.distance_between_objects'] + vehicle.length:
-                    break
-            else:
-                target_direction = target_lane.direction
-                # Randomly select a vehicle type
-                vehicle_type = random.choice(list(self.vehicle_types.values()))
-                new_vehicle = Vehicle(position=target_position, direction=target_direction, current_lane=target_lane,
-                                      vehicle_reference=vehicle_type['reference'], config=self.config,
-                                      length=vehicle_type['length'], width=vehicle_type['width'])
+            for index, (x, y) in zip(indices[keep], points[keep]):
+                target_lane = lanes[index]
+                target_position = Vector(x, y)
 
-                waypoints = cal_waypoints(target_position, target_lane.end, self.config['traffic.gap_between_waypoints'])
+                possible_vehicles = target_lane.vehicles
+                for vehicle in possible_vehicles:
+                    # check if the vehicle is too close to another vehicle
+                    if vehicle.position.distance_sq(target_position) < (2 * self.config['traffic.distance_between_objects'] + vehicle.length) ** 2:
+                        break
+                else:
+                    target_direction = target_lane.direction
+                    # Randomly select a vehicle type
+                    vehicle_type = random.choice(vehicle_types)
+                    new_vehicle = Vehicle(position=target_position, direction=target_direction, current_lane=target_lane,
+                                          vehicle_reference=vehicle_type['reference'], config=self.config,
+                                          length=vehicle_type['length'], width=vehicle_type['width'])
+
+                    waypoints = cal_waypoints(target_position, target_lane.end, self.config['traffic.gap_between_waypoints'])
 
-                new_vehicle.add_waypoint(waypoints)
-                target_lane.add_vehicle(new_vehicle)
-                self.vehicles.append(new_vehicle)
+                    new_vehicle.add_waypoint(waypoints)
+                    target_lane.add_vehicle(new_vehicle)
+                    self.vehicles.append(new_vehicle)
 
-                self.logger.info(f"Spawned Vehicle: {new_vehicle.id} of type {vehicle_type['name']} on Lane {target_lane.id} at {target_position}")
+                    self.logger.info(f"Spawned Vehicle: {new_vehicle.id} of type {vehicle_type['name']} on Lane {target_lane.id} at {target_position}")
 
     def spawn_vehicles(self, communicator):
         """Spawn vehicles in the simulation environment.
@@ -96,16 +110,19 @@ class VehicleManager:
             intersection_controller: Controller for managing intersection logic.
             pedestrians: List of pedestrians to check for collision avoidance.
         """
+        # Positions do not change during an update, so gather them once for all the proximity checks
+        object_states = gather_object_states(self.vehicles, pedestrians)
+
         for vehicle in self.vehicles:
             # update vehicle waypoints
             if vehicle.waypoints and len(vehicle.waypoints) > 0:
                 # Calculate vector from current position to waypoint
                 to_waypoint = vehicle.waypoints[0] - vehicle.position
-                # Calculate dot product between vehicle direction and to_waypoint vector
-                dot_product = vehicle.direction.dot(to_waypoint.normalize())
+                # Calculate dot product between vehicle direction and to_waypoint vector, only its sign matters
+                dot_product = vehicle.direction.dot(to_waypoint)
                 # If angle is greater than 90 degrees (dot product < 0), remove the waypoint
                 if dot_product < 0:
-                    vehicle.waypoints.pop(0)
+                    vehicle.pop_waypoint()
 
             if vehicle.state == VehicleState.WAITING:
                 communicator.vehicle_make_u_turn(vehicle.id)
@@ -119,8 +136,8 @@ class VehicleManager:
                 else:
                     continue
 
-            if vehicle.is_close_to_object(self.vehicles, pedestrians):
-                self.logger.debug(f'Vehicle {vehicle.id} is close to another vehicle, stop it')
+            if vehicle.is_close_to_object(self.vehicles, pedestrians, object_states):
+                self.logger.debug('Vehicle %s is close to another vehicle, stop it', vehicle.id)
                 if not vehicle.state == VehicleState.STOPPED:
                     vehicle.set_attributes(0, 1, 0)  # throttle = 0, brake = 1, steering = 0
                     vehicle.state = VehicleState.STOPPED
@@ -128,7 +145,7 @@ class VehicleManager:
 
             # Check if vehicle has reached current waypoint
             if vehicle.is_close_to_end():
-                self.logger.debug(f'Vehicle {vehicle.id} has reached current waypoint, get next waypoints')
+                self.logger.debug('Vehicle %s has reached current waypoint, get next waypoints', vehicle.id)
                 next_lane, waypoints, current_intersection, is_u_turn = intersection_controller.get_waypoints_for_vehicle(vehicle.current_lane)
 
                 if is_u_turn:
@@ -141,12 +158,12 @@ class VehicleManager:
                 else:
                     vehicle_light_state, _ = current_intersection.get_traffic_light_state(vehicle.current_lane)
                     if vehicle_light_state == TrafficSignalState.VEHICLE_GREEN:
-                        self.logger.debug(f'Vehicle {vehicle.id} has green light on lane {vehicle.current_lane.id}, add waypoints')
+                        self.logger.debug('Vehicle %s has green light on lane %s, add waypoints', vehicle.id, vehicle.current_lane.id)
                         vehicle.add_waypoint(waypoints)
                         vehicle.change_to_next_lane(next_lane)
                     else:
                         if not vehicle.state == VehicleState.STOPPED:
-                            self.logger.debug(f'Vehicle {vehicle.id} has red light on lane {vehicle.current_lane.id}, stop it')
+                            self.logger.debug('Vehicle %s has red light on lane %s, stop it', vehicle.id, vehicle.current_lane.id)
                             # communicator.set_state(vehicle.vehicle_id, 0, 1, 0)
                             vehicle.set_attributes(0, 1, 0)  # throttle = 0, brake = 1, steering = 0
                             vehicle.state = VehicleState.STOPPED
@@ -7,6 +7,9 @@ import math
 
 from simworld.citygen.dataclass.dataclass import Bounds
 
+# Slack for rejection tests, so boxes that touch still overlap despite rounding in rotated coordinates
+_ENVELOPE_EPSILON = 1e-9
+
 
 class BboxUtils:
     """Utility class for bounding box operations.
@@ -14,6 +17,27 @@ class BboxUtils:
     Provides static methods for geometric operations on bounding boxes,
     particularly for detecting collisions between rotated rectangles.
     """
+    @staticmethod
+    def get_envelope(bounds: Bounds):
+        """Get the axis-aligned box enclosing a rotated bounding box.
+
+        Args:
+            bounds: The bounding box.
+
+        Returns:
+            Tuple of (min_x, min_y, max_x, max_y).
+        """
+        cx = bounds.x + bounds.width / 2
+        cy = bounds.y + bounds.height / 2
+        if not bounds.rotation:
+            half_x, half_y = bounds.width / 2, bounds.height / 2
+        else:
+            angle = math.radians(bounds.rotation)
+            cos_a, sin_a = abs(math.cos(angle)), abs(math.sin(angle))
+            half_x = (bounds.width * cos_a + bounds.height * sin_a) / 2
+            half_y = (bounds.width * sin_a + bounds.height * cos_a) / 2
+        return cx - half_x, cy - half_y, cx + half_x, cy + half_y
+
     @staticmethod
     def bbox_overlap(a: Bounds, b: Bounds) -> bool:
         """Check if two rotated bounding boxes overlap without using shapely.
@@ -25,126 +49,44 @@ class BboxUtils:
         Returns:
             True if the bounding boxes overlap, False otherwise.
         """
-        def rotate_point(cx, cy, x, y, angle):
-            """Rotate a point around a center by a given angle (in radians).
-
-            Args:
-                cx: Center x coordinate.
-                cy: Center y coordinate.
-                x: Point x coordinate.
-                y: Point y coordinate.
-                angle: Rotation angle in radians.
-
-            Returns:
-                Tuple of rotated (x, y) coordinates.
-            """
-            dx, dy = x - cx, y - cy
-            rotated_x = cx + dx * math.cos(angle) - dy * math.sin(angle)
-            rotated_y = cy + dx * math.sin(angle) + dy * math.cos(angle)
-            return rotated_x, rotated_y
-
-        def get_corners(bounds):
-            """Get the rotated corners of a bounding box.
-
-            Args:
-                bounds: The bounding box.
-
-            Returns:
-                List of corner coordinates as (x, y) tuples.
-            """
-            cx = bounds.x + bounds.width / 2
-            cy = bounds.y + bounds.height / 2
-            w2, h2 = bounds.width / 2, bounds.height / 2
-            corners = [
-                (-w2, -h2), (w2, -h2),
-                (w2, h2), (-w2, h2)
-            ]
-            angle = math.radians(bounds.rotation)
-            return [rotate_point(cx, cy, cx + x, cy + y, angle) for x, y in corners]
-
-        def is_point_in_polygon(px, py, polygon):
-            """Check if a point is inside a polygon using the ray-casting method.
-
-            Args:
-                px: Point x coordinate.
-                py: Point y coordinate.
-                polygon: List of vertex coordinates forming the polygon.
-
-            Returns:
-                True if the point is inside the polygon, False otherwise.
-            """
-            n = len(polygon)
-            inside = False
-            x1, y1 = polygon[0]
-            for i in range(1, n + 1):
-                x2, y2 = polygon[i % n]
-                if min(y1, y2) < py <= max(y1, y2) and px <= max(x1, x2):
-                    if y1 != y2:
-                        xinters = (py - y1) * (x2 - x1) / (y2 - y1) + x1
-                    if x1 == x2 or px <= xinters:
-                        inside = not inside
-                x1, y1 = x2, y2
-            return inside
-
-        def do_segments_intersect(p1, q1, p2, q2):
-            """Check if two line segments intersect.
-
-            Args:
-                p1: First point of first segment.
-                q1: Second point of first segment.
-                p2: First point of second segment.
-                q2: Second point of second segment.
-
-            Returns:
-                True if the segments intersect, False otherwise.
-            """
-            def orientation(p, q, r):
-                val = (q[1] - p[1]) * (r[0] - q[0]) - (q[0] - p[0]) * (r[1] - q[1])
-                if val == 0:
-                    return 0
-                return 1 if val > 0 else 2
-
-            def on_segment(p, q, r):
-                return min(p[0], r[0]) <= q[0] <= max(p[0], r[0]) and min(p[1], r[1]) <= q[1] <= max(p[1], r[1])
-
-            o1 = orientation(p1, q1, p2)
-            o2 = orientation(p1, q1, q2)
-            o3 = orientation(p2, q2, p1)
-            o4 = orientation(p2, q2, q1)
-
-            if o1 != o2 and o3 != o4:
-                return True
-            if o1 == 0 and on_segment(p1, p2, q1):
-                return True
-            if o2 == 0 and on_segment(p1, q2, q1):
-                return True
-            if o3 == 0 and on_segment(p2, p1, q2):
-                return True
-            if o4 == 0 and on_segment(p2, q1, q2):
-                return True
+        # Most pairs coming from a quadtree query are far apart, and most unrotated pairs need no polygon test at all
+        a_min_x, a_min_y, a_max_x, a_max_y = BboxUtils.get_envelope(a)
+        b_min_x, b_min_y, b_max_x, b_max_y = BboxUtils.get_envelope(b)
+        if not a.rotation and not b.rotation:
+            return a_min_x <= b_max_x and b_min_x <= a_max_x and a_min_y <= b_max_y and b_min_y <= a_max_y
+        if (a_max_x + _ENVELOPE_EPSILON < b_min_x or b_max_x + _ENVELOPE_EPSILON < a_min_x
+                or a_max_y + _ENVELOPE_EPSILON < b_min_y or b_max_y + _ENVELOPE_EPSILON < a_min_y):
             return False
 
-        # Get rotated corners
-        a_corners = get_corners(a)
-        b_corners = get_corners(b)
-
-        # Check if any corner of A is inside B
-        for corner in a_corners:
-            if is_point_in_polygon(corner[0], corner[1], b_corners):
-                return True
+        return BboxUtils._separating_axis_overlap(a, b)
 
-        # Check if any corner of B is inside A
-        for corner in b_corners:
-            if is_point_in_polygon(corner[0], corner[1], a_corners):
-                return True
+    @staticmethod
+    def _separating_axis_overlap(a: Bounds, b: Bounds) -> bool:
+        """Check if two rotated bounding boxes overlap with the separating axis theorem.
 
-        # Check if any edge of A intersects with any edge of B
-        a_edges = [(a_corners[i], a_corners[(i + 1) % 4]) for i in range(4)]
-        b_edges = [(b_corners[i], b_corners[(i + 1) % 4]) for i in range(4)]
+        Two rectangles are disjoint exactly when their projections are disjoint on one of their four edge
+        directions, so no corners or edge intersections have to be computed. Touching boxes count as overlapping.
 
-        for edge_a in a_edges:
-            for edge_b in b_edges:
-                if do_segments_intersect(edge_a[0], edge_a[1], edge_b[0], edge_b[1]):
-                    return True
+        Args:
+            a: First bounding box.
+            b: Second bounding box.
 
-        return False
+        Returns:
+            True if the bounding boxes overlap, False otherwise.
+        """
+        a_angle = math.radians(a.rotation)
+        b_angle = math.radians(b.rotation)
+        a_cos, a_sin = math.cos(a_angle), math.sin(a_angle)
+        b_cos, b_sin = math.cos(b_angle), math.sin(b_angle)
+        a_w2, a_h2 = a.width / 2, a.height / 2
+        b_w2, b_h2 = b.width / 2, b.height / 2
+        dx = (b.x + b_w2) - (a.x + a_w2)
+        dy = (b.y + b_h2) - (a.y + a_h2)
+
+        # Edge directions of both boxes, as (x, y) unit vectors
+        for axis_x, axis_y in ((a_cos, a_sin), (-a_sin, a_cos), (b_cos, b_sin), (-b_sin, b_cos)):
+            a_radius = a_w2 * abs(a_cos * axis_x + a_sin * axis_y) + a_h2 * abs(a_cos * axis_y - a_sin * axis_x)
+            b_radius = b_w2 * abs(b_cos * axis_x + b_sin * axis_y) + b_h2 * abs(b_cos * axis_y - b_sin * axis_x)
+            if abs(dx * axis_x + dy * axis_y) > a_radius + b_radius + _ENVELOPE_EPSILON:
+                return False
+        return True
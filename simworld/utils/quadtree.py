@@ -1,4 +1,7 @@
 """Quadtree implementation for efficient spatial partitioning and querying."""
+import heapq
+import itertools
+import math
 from typing import Generic, List, Optional, TypeVar
 
 from simworld.citygen.dataclass.dataclass import Bounds
@@ -6,6 +9,12 @@ from simworld.citygen.dataclass.dataclass import Bounds
 T = TypeVar('T')
 
 
+def _distance_to_rect(x: float, y: float, min_x: float, min_y: float, max_x: float, max_y: float) -> float:
+    dx = max(min_x - x, 0.0, x - max_x)
+    dy = max(min_y - y, 0.0, y - max_y)
+    return math.hypot(dx, dy)
+
+
 class QuadTree(Generic[T]):
     """Quadtree data structure for efficient spatial partitioning and querying.
 
@@ -159,6 +168,58 @@ class QuadTree(Generic[T]):
                 result.append(item)
         return result
 
+    def nearest(self, x: float, y: float, k: int = 1) -> List[T]:
+        """Retrieve the k items whose bounding rectangles are closest to a point.
+
+        Nodes are visited best-first by their distance to the point, so only the part of the tree around
+        the point is searched.
+
+        Args:
+            x: X coordinate of the point.
+            y: Y coordinate of the point.
+            k: Number of items to retrieve.
+
+        Returns:
+            Up to k items, nearest first.
+        """
+        if k <= 0:
+            return []
+        tie_breaker = itertools.count()
+        # Each node is responsible for the region its parent routes to it, outer nodes extend to infinity
+        nodes = [(0.0, next(tie_breaker), self, (-math.inf, -math.inf, math.inf, math.inf))]
+        # Max-heap of the best items found so far, by negated distance
+        best = []
+        seen = set()
+        while nodes:
+            node_distance, _, node, (min_x, min_y, max_x, max_y) = heapq.heappop(nodes)
+            if len(best) == k and node_distance > -best[0][0]:
+                break
+            if any(node.nodes):
+                mid_x = node.bounds.x + node.bounds.width / 2
+                mid_y = node.bounds.y + node.bounds.height / 2
+                regions = (
+                    (mid_x, min_y, max_x, mid_y),
+                    (min_x, min_y, mid_x, mid_y),
+                    (min_x, mid_y, mid_x, max_y),
+                    (mid_x, mid_y, max_x, max_y),
+                )
+                for child, region in zip(node.nodes, regions):
+                    if child is not None:
+                        heapq.heappush(nodes, (_distance_to_rect(x, y, *region), next(tie_breaker), child, region))
+                continue
+
+            for rect, item in zip(node.objects, node.items):
+                # Items spanning several leaves are stored in each of them
+                if id(item) in seen:
+                    continue
+                seen.add(id(item))
+                distance = _distance_to_rect(x, y, rect.x, rect.y, rect.x + rect.width, rect.y + rect.height)
+                if len(best) < k:
+                    heapq.heappush(best, (-distance, next(tie_breaker), item))
+                elif distance < -best[0][0]:
+                    heapq.heapreplace(best, (-distance, next(tie_breaker), item))
+        return [item for _, _, item in sorted(best, key=lambda entry: (-entry[0], entry[1]))]
+
     def clear(self):
         """Clear the quadtree, removing all items and resetting to initial state."""
         self.objects = []
@@ -144,8 +144,8 @@ class RoadUtils:
                 closest_point = other_segment.end
         if closest_point is not None:
             if point_type == 'start':
-                segment.start = closest_point
+                segment.set_endpoints(closest_point, segment.end)
             else:
-                segment.end = closest_point
+                segment.set_endpoints(segment.start, closest_point)
             return True
         return False
@@ -84,3 +84,21 @@ def cal_waypoints(start: Vector, end: Vector, gap_between_waypoints: float) -> l
         waypoints.append(start + (end - start) * fraction)
     waypoints.append(end)
     return waypoints
+
+
+def sample_points_on_segments(starts: np.ndarray, ends: np.ndarray, num_points: int, rng: np.random.Generator):
+    """Sample points uniformly along randomly chosen segments in one vectorized pass.
+
+    Args:
+        starts: Segment start points with shape (N, 2).
+        ends: Segment end points with shape (N, 2).
+        num_points: Number of points to sample.
+        rng: NumPy random generator.
+
+    Returns:
+        Tuple of (segment indices, fractions along the segments, points with shape (num_points, 2)).
+    """
+    indices = rng.integers(0, len(starts), num_points)
+    fractions = rng.random(num_points)
+    points = starts[indices] + fractions[:, None] * (ends[indices] - starts[indices])
+    return indices, fractions, points
@@ -1,4 +1,5 @@
 """Two-dimensional vector utilities module, providing Vector class and related operations."""
+import math
 from dataclasses import dataclass
 
 
@@ -13,6 +14,8 @@ class Vector:
         y: Y coordinate.
     """
 
+    __slots__ = ('x', 'y')
+
     x: float
     y: float
 
@@ -23,11 +26,16 @@ class Vector:
             x: X coordinate.
             y: Y coordinate.
         """
-        if y is None and isinstance(x, (list, tuple)):
+        if y is not None:
+            # Fast path for the common (x, y) form used by all vector arithmetic
+            self.x = round(float(x), 4)
+            self.y = round(float(y), 4)
+            return
+        if isinstance(x, (list, tuple)):
             # Handle list/tuple input like [1, 1] or (1, 1)
             self.x = float(x[0])
             self.y = float(x[1])
-        elif y is None and isinstance(x, str):
+        elif isinstance(x, str):
             # Handle string input
             # Remove all whitespace and unnecessary characters
             clean_str = x.replace(' ', '').strip('()[]{}')
@@ -38,14 +46,14 @@ class Vector:
                 self.y = float(coords[1])
             else:
                 raise ValueError(f'Invalid vector string format: {x}')
-        elif y is None and isinstance(x, dict):
+        elif isinstance(x, dict):
             # Handle dictionary input
             self.x = float(x.get('x', x.get(0, 0)))
             self.y = float(x.get('y', x.get(1, 0)))
         else:
-            # Handle traditional x, y input
+            # Handle a single scalar as the x coordinate
             self.x = float(x)
-            self.y = float(y) if y is not None else 0.0
+            self.y = 0.0
 
         # Round values as per original implementation
         self.x = round(self.x, 4)
@@ -62,7 +70,7 @@ class Vector:
         Returns:
             Normalized vector.
         """
-        magnitude = (self.x ** 2 + self.y ** 2) ** 0.5
+        magnitude = math.hypot(self.x, self.y)
         if magnitude == 0:
             return Vector(0, 0)
         return Vector(round(self.x / magnitude, 4), round(self.y / magnitude, 4))
@@ -120,7 +128,22 @@ class Vector:
         Returns:
             Euclidean distance between the two vectors.
         """
-        return ((self.x - other.x) ** 2 + (self.y - other.y) ** 2) ** 0.5
+        return math.hypot(self.x - other.x, self.y - other.y)
+
+    def distance_sq(self, other: 'Vector') -> float:
+        """Calculate squared distance to another vector.
+
+        Cheaper than distance when only comparing against a threshold.
+
+        Args:
+            other: Another vector.
+
+        Returns:
+            Squared Euclidean distance between the two vectors.
+        """
+        dx = self.x - other.x
+        dy = self.y - other.y
+        return dx * dx + dy * dy
 
     def __eq__(self, other: 'Vector') -> bool:
         """Check if two vectors are equal.
@@ -172,4 +195,4 @@ class Vector:
         Returns:
             Length of the vector.
         """
-        return round(((self.x ** 2 + self.y ** 2) ** 0.5), 4)
+        return round(math.hypot(self.x, self.y), 4)